@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import json
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from fastapi import FastAPI
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, Response
 
 from cite_right import (
     CitationConfig,
@@ -13,11 +16,12 @@ from cite_right import (
     SpacyAnswerSegmenter,
     align_citations,
 )
+from cite_right.core.aligner_py import SmithWatermanAligner
+from cite_right.core.aligner_rust import RustSmithWatermanAligner
+from cite_right.core.interfaces import Aligner
 
 from .example_data import ANSWER, QUESTION, SOURCES
 
-app = FastAPI(title="Cite-Right Perplexity Demo")
-
 
 def _init_segmenters() -> tuple[SpacyAnswerSegmenter | None, PySBDSegmenter | None]:
     try:
@@ -27,17 +31,33 @@ def _init_segmenters() -> tuple[SpacyAnswerSegmenter | None, PySBDSegmenter | No
         return None, None
 
 
+def _init_aligner(config: CitationConfig) -> Aligner:
+    kwargs = {
+        "match_score": config.match_score,
+        "mismatch_score": config.mismatch_score,
+        "gap_score": config.gap_score,
+        "return_match_blocks": config.multi_span_evidence,
+    }
+    try:
+        return RustSmithWatermanAligner(**kwargs)
+    except RuntimeError as exc:
+        print(f"Aligner fallback: {exc}")
+        return SmithWatermanAligner(**kwargs)
+
+
+CONFIG = CitationConfig(top_k=2, allow_embedding_only=False)
 ANSWER_SEGMENTER, SOURCE_SEGMENTER = _init_segmenters()
+ALIGNER = _init_aligner(CONFIG)
 
 
 def _build_citations_payload() -> dict[str, Any]:
-    config = CitationConfig(top_k=2, allow_embedding_only=False)
     results = align_citations(
         ANSWER,
         SOURCES,
-        config=config,
+        config=CONFIG,
         answer_segmenter=ANSWER_SEGMENTER,
         source_segmenter=SOURCE_SEGMENTER,
+        aligner=ALIGNER,
     )
 
     spans: list[dict[str, Any]] = []
@@ -69,10 +89,25 @@ def _build_citations_payload() -> dict[str, Any]:
     return {"question": QUESTION, "answer": ANSWER, "spans": spans, "sources": sources}
 
 
+@lru_cache(maxsize=1)
+def _citations_json() -> bytes:
+    # ANSWER and SOURCES are static, so the payload only needs to be built once.
+    return json.dumps(_build_citations_payload()).encode("utf-8")
+
+
+@asynccontextmanager
+async def _lifespan(_: FastAPI) -> AsyncIterator[None]:
+    # Build the static payload at startup so the first request is served warm.
+    _citations_json()
+    yield
+
+
+app = FastAPI(title="Cite-Right Perplexity Demo", lifespan=_lifespan)
+
+
 @app.get("/api/citations")
-def get_citations() -> JSONResponse:
-    payload = _build_citations_payload()
-    return JSONResponse(payload)
+def get_citations() -> Response:
+    return Response(_citations_json(), media_type="application/json")
 
 
 @app.get("/", response_class=HTMLResponse)
@@ -229,18 +229,7 @@ pub fn align_topk(
     let mut results: Vec<CandidateAlignment> = seqs
         .par_iter()
         .enumerate()
-        .map(|(index, seq2)| {
-            let alignment = smith_waterman(seq1, seq2, params);
-            CandidateAlignment {
-                score: alignment.score,
-                index,
-                query_start: alignment.query_start,
-                query_end: alignment.query_end,
-                token_start: alignment.token_start,
-                token_end: alignment.token_end,
-                matches: alignment.matches,
-            }
-        })
+        .map(|(index, seq2)| align_candidate(seq1, seq2, index, params))
         .collect();
 
     results.sort_by(cmp_candidate);
@@ -253,7 +242,30 @@ pub fn align_best(
     seqs: &[Vec<u32>],
     params: ScoreParams,
 ) -> Option<CandidateAlignment> {
-    align_topk(seq1, seqs, params, 1).into_iter().next()
+    // A parallel reduction keeps only the running best instead of collecting
+    // and sorting every candidate as `align_topk` does.
+    seqs.par_iter()
+        .enumerate()
+        .map(|(index, seq2)| align_candidate(seq1, seq2, index, params))
+        .min_by(cmp_candidate)
+}
+
+fn align_candidate(
+    seq1: &[u32],
+    seq2: &[u32],
+    index: usize,
+    params: ScoreParams,
+) -> CandidateAlignment {
+    let alignment = smith_waterman(seq1, seq2, params);
+    CandidateAlignment {
+        score: alignment.score,
+        index,
+        query_start: alignment.query_start,
+        query_end: alignment.query_end,
+        token_start: alignment.token_start,
+        token_end: alignment.token_end,
+        matches: alignment.matches,
+    }
 }
 
 fn choose_direction(best: i32, score_diag: i32, score_up: i32, _score_left: i32) -> u8 {
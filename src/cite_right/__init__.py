@@ -1,4 +1,11 @@
-from cite_right.citations import AlignmentMetrics, align_citations
+import importlib
+from typing import TYPE_CHECKING
+
+from cite_right.citations import (
+    AlignmentMetrics,
+    align_citations,
+    clear_source_cache,
+)
 from cite_right.claims import (
     Claim,
     ClaimDecomposer,
@@ -39,10 +46,6 @@ from cite_right.hallucination import (
 from cite_right.integrations import (
     LANGCHAIN_AVAILABLE,
     LLAMAINDEX_AVAILABLE,
-    LangChainDocument,
-    LlamaIndexNode,
-    LlamaIndexNodeWithScore,
-    LlamaIndexTextNode,
     from_dicts,
     from_langchain_chunks,
     from_langchain_documents,
@@ -53,22 +56,59 @@ from cite_right.integrations import (
     is_llamaindex_available,
     is_llamaindex_node,
 )
-from cite_right.models.sbert_embedder import SentenceTransformerEmbedder
-from cite_right.text.answer_segmenter_spacy import SpacyAnswerSegmenter
-from cite_right.text.segmenter_pysbd import PySBDSegmenter
-from cite_right.text.segmenter_spacy import SpacySegmenter
 from cite_right.text.tokenizer import SimpleTokenizer, TokenizerConfig
-from cite_right.text.tokenizer_huggingface import HuggingFaceTokenizer
-from cite_right.text.tokenizer_tiktoken import TiktokenTokenizer
+
+if TYPE_CHECKING:
+    from cite_right.integrations import (
+        LangChainDocument,
+        LlamaIndexNode,
+        LlamaIndexNodeWithScore,
+        LlamaIndexTextNode,
+    )
+    from cite_right.models.sbert_embedder import SentenceTransformerEmbedder
+    from cite_right.text.answer_segmenter_spacy import SpacyAnswerSegmenter
+    from cite_right.text.segmenter_pysbd import PySBDSegmenter
+    from cite_right.text.segmenter_spacy import SpacySegmenter
+    from cite_right.text.tokenizer_huggingface import HuggingFaceTokenizer
+    from cite_right.text.tokenizer_tiktoken import TiktokenTokenizer
 
 __version__ = "0.4.0"
 
+_LAZY_EXPORTS: dict[str, str] = {
+    "HuggingFaceTokenizer": "cite_right.text.tokenizer_huggingface",
+    "LangChainDocument": "cite_right.integrations",
+    "LlamaIndexNode": "cite_right.integrations",
+    "LlamaIndexNodeWithScore": "cite_right.integrations",
+    "LlamaIndexTextNode": "cite_right.integrations",
+    "PySBDSegmenter": "cite_right.text.segmenter_pysbd",
+    "SentenceTransformerEmbedder": "cite_right.models.sbert_embedder",
+    "SpacyAnswerSegmenter": "cite_right.text.answer_segmenter_spacy",
+    "SpacySegmenter": "cite_right.text.segmenter_spacy",
+    "TiktokenTokenizer": "cite_right.text.tokenizer_tiktoken",
+}
+"""Exports wrapping optional backends, imported on first attribute access."""
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
+
 __all__ = [
     "__version__",
     # Core API
     "align_citations",
     "compute_hallucination_metrics",
     "verify_facts",
+    "clear_source_cache",
     # Convenience functions
     "annotate_answer",
     "check_groundedness",
@@ -1,40 +1,54 @@
 from __future__ import annotations
 
 import math
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Literal, Sequence, TypeAlias
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict
 
+from cite_right.core import aligner_numba
 from cite_right.core.aligner_py import SmithWatermanAligner
 from cite_right.core.aligner_rust import RustSmithWatermanAligner
 from cite_right.core.citation_config import CitationConfig
+from cite_right.core.hashing import text_digest
 from cite_right.core.interfaces import Aligner, AnswerSegmenter, Segmenter, Tokenizer
 from cite_right.core.results import (
     Alignment,
     AnswerSpan,
     Citation,
     EvidenceSpan,
+    Segment,
     SourceChunk,
     SourceDocument,
     SpanCitations,
+    TokenizedText,
 )
 from cite_right.models.base import Embedder
 from cite_right.models.embedding_index import EmbeddingIndex
 from cite_right.text.answer_segmenter import SimpleAnswerSegmenter
-from cite_right.text.passage import Passage, generate_passages
+from cite_right.text.passage import Passage, passages_from_segments
 from cite_right.text.segmenter_simple import SimpleSegmenter
 from cite_right.text.tokenizer import SimpleTokenizer
 
 CandidateSelection: TypeAlias = list[tuple[int, float, float]]
 """List of (candidate_index, embedding_score, lexical_score) tuples."""
 
+EmbeddingHits: TypeAlias = list[tuple[int, float]]
+"""List of (candidate_index, embedding_score) tuples, best first."""
+
 LexicalScores: TypeAlias = dict[int, float]
 """Mapping from candidate index to lexical similarity score."""
 
 IdfWeights: TypeAlias = dict[int, float]
 """Mapping from token ID to IDF weight."""
 
+_SOURCE_CACHE_SIZE = 16
+_MIN_PARALLEL_SPANS = 5
+_MAX_PARALLEL_WORKERS = 8
+
 
 class AlignmentMetrics(BaseModel):
     """Observability metrics for the alignment pipeline.
@@ -61,6 +75,8 @@ class AlignmentMetrics(BaseModel):
 MetricsCallback: TypeAlias = Callable[[AlignmentMetrics], None]
 """Callback function for receiving alignment metrics."""
 
+_EMPTY_ALIGNMENT = Alignment(score=0, token_start=0, token_end=0)
+
 
 class _NormalizedSource(BaseModel):
     model_config = ConfigDict(frozen=True)
@@ -83,25 +99,6 @@ class _Candidate(BaseModel):
     token_set: frozenset[int]
 
 
-class _EmbeddingCache(BaseModel):
-    """Cache for batched answer span embeddings."""
-
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-
-    embedder: Embedder
-    answer_spans: list[AnswerSpan]
-    vectors: list[list[float]] = Field(default_factory=list)
-    _computed: bool = False
-
-    def get_vector(self, span_index: int) -> list[float]:
-        """Get the embedding vector for an answer span, computing batch if needed."""
-        if not self._computed:
-            texts = [span.text for span in self.answer_spans]
-            self.vectors = self.embedder.encode(texts)
-            self._computed = True
-        return self.vectors[span_index]
-
-
 class _SpanProcessingResult(BaseModel):
     """Result of processing a single answer span."""
 
@@ -109,10 +106,28 @@ class _SpanProcessingResult(BaseModel):
 
     span_citations: SpanCitations
     num_alignments: int
-    embedding_time_ms: float
     alignment_time_ms: float
 
 
+class _PreparedSources(BaseModel):
+    """Source candidates shared by every answer span of an alignment run."""
+
+    model_config = ConfigDict(frozen=True)
+
+    candidates: list[_Candidate]
+    idf: IdfWeights
+
+
+class _CachedSources(BaseModel):
+    """A cached source preparation with the components that produced it."""
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    segmenter: Segmenter
+    tokenizer: Tokenizer
+    prepared: _PreparedSources
+
+
 def _report_empty_metrics(on_metrics: MetricsCallback | None) -> None:
     """Report metrics for empty/skipped alignment."""
     if on_metrics is not None:
@@ -130,18 +145,31 @@ def _setup_embeddings(
     embedder: Embedder | None,
     candidates: list[_Candidate],
     answer_spans: list[AnswerSpan],
-) -> tuple[EmbeddingIndex | None, _EmbeddingCache | None, float]:
-    """Set up embedding index and cache for semantic matching."""
-    if embedder is None:
-        return None, None, 0.0
+    cfg: CitationConfig,
+) -> tuple[list[EmbeddingHits], float]:
+    """Find the top embedding candidates for every answer span.
+
+    All distinct texts are encoded in a single `embedder.encode` call, which
+    lets batching embedders amortize their per-call overhead, and all spans
+    are scored against all passages with one matrix product.
+    """
+    if embedder is None or not candidates:
+        return [[] for _ in answer_spans], 0.0
 
     embed_start = time.perf_counter()
-    embedding_index = EmbeddingIndex.build(
-        embedder, [candidate.passage.text for candidate in candidates]
+    passage_texts = [candidate.passage.text for candidate in candidates]
+    span_texts = [span.text for span in answer_spans]
+    unique_texts = list(dict.fromkeys([*passage_texts, *span_texts]))
+    vectors = dict(zip(unique_texts, embedder.encode(unique_texts), strict=True))
+
+    embedding_index = EmbeddingIndex.from_vectors(
+        [vectors[text] for text in passage_texts]
+    )
+    embedding_hits = embedding_index.top_k_many(
+        [vectors[text] for text in span_texts], cfg.max_candidates_embedding
     )
-    embedding_cache = _EmbeddingCache(embedder=embedder, answer_spans=answer_spans)
     embedding_time = (time.perf_counter() - embed_start) * 1000
-    return embedding_index, embedding_cache, embedding_time
+    return embedding_hits, embedding_time
 
 
 def align_citations(
@@ -229,36 +257,21 @@ def align_citations(
     tokenizer = tokenizer or SimpleTokenizer()
     aligner = aligner or _default_aligner(cfg, backend=backend)
 
-    normalized_sources = _normalize_sources(sources)
     answer_spans = answer_segmenter.segment(answer)
-    source_passages = _build_source_passages(normalized_sources, source_segmenter, cfg)
-    candidates = _build_candidates(source_passages, tokenizer)
-    idf = _compute_idf(candidates)
-
-    embedding_index, embedding_cache, embedding_time = _setup_embeddings(
-        embedder, candidates, answer_spans
+    prepared = _prepare_sources(
+        _normalize_sources(sources), source_segmenter, tokenizer, cfg
     )
-
-    output: list[SpanCitations] = []
-    num_alignments = 0
-    alignment_time = 0.0
-
-    for span_index, answer_span in enumerate(answer_spans):
-        span_result = _process_answer_span(
-            span_index=span_index,
-            answer_span=answer_span,
-            tokenizer=tokenizer,
-            candidates=candidates,
-            idf=idf,
-            embedding_cache=embedding_cache,
-            embedding_index=embedding_index,
-            aligner=aligner,
-            cfg=cfg,
-        )
-        output.append(span_result.span_citations)
-        num_alignments += span_result.num_alignments
-        embedding_time += span_result.embedding_time_ms
-        alignment_time += span_result.alignment_time_ms
+    span_results, embedding_time = _align_answer_spans(
+        answer_spans,
+        prepared,
+        tokenizer=tokenizer,
+        aligner=aligner,
+        embedder=embedder,
+        cfg=cfg,
+    )
+    output = [result.span_citations for result in span_results]
+    num_alignments = sum(result.num_alignments for result in span_results)
+    alignment_time = sum(result.alignment_time_ms for result in span_results)
 
     if on_metrics is not None:
         total_time = (time.perf_counter() - start_time) * 1000
@@ -266,7 +279,7 @@ def align_citations(
             AlignmentMetrics(
                 total_time_ms=total_time,
                 num_answer_spans=len(answer_spans),
-                num_candidates=len(candidates),
+                num_candidates=len(prepared.candidates),
                 num_alignments=num_alignments,
                 embedding_time_ms=embedding_time,
                 alignment_time_ms=alignment_time,
@@ -276,50 +289,237 @@ def align_citations(
     return output
 
 
+def _align_citations_batch(
+    answers: Sequence[str],
+    sources: Sequence[str | SourceDocument | SourceChunk],
+    *,
+    config: CitationConfig | None = None,
+    backend: Literal["auto", "python", "rust"] = "auto",
+    answer_segmenter: AnswerSegmenter | None = None,
+    source_segmenter: Segmenter | None = None,
+    tokenizer: Tokenizer | None = None,
+    aligner: Aligner | None = None,
+    embedder: Embedder | None = None,
+) -> list[list[SpanCitations]]:
+    """Align several answers against the same sources.
+
+    Equivalent to calling `align_citations` once per answer, except that the
+    sources are segmented, tokenized and embedded only once, and the spans of
+    all answers share a single `embedder.encode` call. When both a source
+    segmenter and a tokenizer are given, the prepared sources are also reused
+    across calls (see `clear_source_cache`).
+
+    Returns:
+        One list of SpanCitations per answer, in input order.
+    """
+    cfg = config or CitationConfig()
+    if cfg.top_k <= 0:
+        return [[] for _ in answers]
+
+    answer_segmenter = answer_segmenter or SimpleAnswerSegmenter()
+    aligner = aligner or _default_aligner(cfg, backend=backend)
+    normalized_sources = _normalize_sources(sources)
+    if source_segmenter is None or tokenizer is None:
+        source_segmenter = source_segmenter or SimpleSegmenter()
+        tokenizer = tokenizer or SimpleTokenizer()
+        prepared = _prepare_sources(
+            normalized_sources, source_segmenter, tokenizer, cfg
+        )
+    else:
+        prepared = _prepare_sources_cached(
+            normalized_sources, source_segmenter, tokenizer, cfg
+        )
+
+    spans_per_answer = [answer_segmenter.segment(answer) for answer in answers]
+    answer_spans = [span for spans in spans_per_answer for span in spans]
+    parallel = len(answer_spans) >= _MIN_PARALLEL_SPANS and _aligner_releases_gil(
+        aligner
+    )
+    span_results, _ = _align_answer_spans(
+        answer_spans,
+        prepared,
+        tokenizer=tokenizer,
+        aligner=aligner,
+        embedder=embedder,
+        cfg=cfg,
+        max_workers=min(_MAX_PARALLEL_WORKERS, len(answer_spans)) if parallel else 1,
+    )
+
+    output: list[list[SpanCitations]] = []
+    offset = 0
+    for spans in spans_per_answer:
+        chunk = span_results[offset : offset + len(spans)]
+        output.append([result.span_citations for result in chunk])
+        offset += len(spans)
+    return output
+
+
+def _prepare_sources(
+    sources: Sequence[_NormalizedSource],
+    segmenter: Segmenter,
+    tokenizer: Tokenizer,
+    cfg: CitationConfig,
+) -> _PreparedSources:
+    """Segment and tokenize the sources into alignment candidates."""
+    source_passages = _build_source_passages(sources, segmenter, cfg)
+    candidates = _build_candidates(source_passages, tokenizer)
+    return _PreparedSources(candidates=candidates, idf=_compute_idf(candidates))
+
+
+_source_cache: OrderedDict[tuple[object, ...], _CachedSources] = OrderedDict()
+_source_cache_lock = threading.Lock()
+
+
+def _prepare_sources_cached(
+    sources: Sequence[_NormalizedSource],
+    segmenter: Segmenter,
+    tokenizer: Tokenizer,
+    cfg: CitationConfig,
+) -> _PreparedSources:
+    """Like `_prepare_sources`, reusing recent preparations of the same sources.
+
+    Entries are keyed by source content, passage window settings and the
+    identities of the segmenter and tokenizer, since token ids are only
+    meaningful for the tokenizer instance that assigned them. Each entry keeps
+    its segmenter and tokenizer alive, so their ids cannot be recycled while
+    the entry is cached.
+    """
+    key = (
+        id(segmenter),
+        id(tokenizer),
+        cfg.window_size_sentences,
+        cfg.window_stride_sentences,
+        *(_source_cache_key(source) for source in sources),
+    )
+    with _source_cache_lock:
+        entry = _source_cache.get(key)
+        if entry is not None:
+            _source_cache.move_to_end(key)
+            return entry.prepared
+
+    prepared = _prepare_sources(sources, segmenter, tokenizer, cfg)
+    with _source_cache_lock:
+        _source_cache[key] = _CachedSources(
+            segmenter=segmenter, tokenizer=tokenizer, prepared=prepared
+        )
+        while len(_source_cache) > _SOURCE_CACHE_SIZE:
+            _source_cache.popitem(last=False)
+    return prepared
+
+
+def _source_cache_key(source: _NormalizedSource) -> tuple[object, ...]:
+    """Return a compact key identifying a normalized source by content."""
+    digest = text_digest(source.text)
+    full_text = source.full_text
+    if full_text is None or full_text is source.text:
+        full_digest = None if full_text is None else digest
+    else:
+        full_digest = text_digest(full_text)
+    return (
+        source.source_id,
+        source.source_index,
+        source.base_doc_offset,
+        digest,
+        full_digest,
+    )
+
+
+def clear_source_cache() -> None:
+    """Drop all source preparations cached by `verify_facts`.
+
+    `verify_facts` reuses the segmented and tokenized sources of recent calls
+    made with the same source segmenter and tokenizer instances. Clearing the
+    cache releases those sources (and the segmenter and tokenizer they pin).
+    """
+    with _source_cache_lock:
+        _source_cache.clear()
+
+
+def _align_answer_spans(
+    answer_spans: list[AnswerSpan],
+    prepared: _PreparedSources,
+    *,
+    tokenizer: Tokenizer,
+    aligner: Aligner,
+    embedder: Embedder | None,
+    cfg: CitationConfig,
+    max_workers: int = 1,
+) -> tuple[list[_SpanProcessingResult], float]:
+    """Cite every answer span against the prepared sources.
+
+    Answer spans are tokenized serially, since tokenizers may keep mutable
+    state such as a growing vocabulary. With `max_workers` above 1 the spans
+    are then aligned on a thread pool; `aligner` must be safe to share
+    between threads.
+
+    Returns:
+        Tuple of (per-span results, embedding time in milliseconds).
+    """
+    embedding_hits, embedding_time = _setup_embeddings(
+        embedder, prepared.candidates, answer_spans, cfg
+    )
+    span_tokens = [
+        tokenized.token_ids
+        for tokenized in _tokenize_texts(
+            tokenizer, [span.text for span in answer_spans]
+        )
+    ]
+
+    def process(index: int) -> _SpanProcessingResult:
+        return _process_answer_span(
+            answer_span=answer_spans[index],
+            answer_tokens=span_tokens[index],
+            candidates=prepared.candidates,
+            idf=prepared.idf,
+            embedding_hits=embedding_hits[index],
+            aligner=aligner,
+            cfg=cfg,
+        )
+
+    if max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            span_results = list(executor.map(process, range(len(answer_spans))))
+    else:
+        span_results = [process(index) for index in range(len(answer_spans))]
+    return span_results, embedding_time
+
+
 def _process_answer_span(
     *,
-    span_index: int,
     answer_span: AnswerSpan,
-    tokenizer: Tokenizer,
+    answer_tokens: list[int],
     candidates: list[_Candidate],
     idf: IdfWeights,
-    embedding_cache: _EmbeddingCache | None,
-    embedding_index: EmbeddingIndex | None,
+    embedding_hits: EmbeddingHits,
     aligner: Aligner,
     cfg: CitationConfig,
 ) -> _SpanProcessingResult:
     """Process a single answer span and return citations with timing info."""
-    embedding_time = 0.0
     alignment_time = 0.0
     num_alignments = 0
 
-    answer_tokenized = tokenizer.tokenize(answer_span.text)
-    answer_tokens = answer_tokenized.token_ids
     citations: list[Citation] = []
 
     if answer_tokens and candidates:
         answer_set = frozenset(answer_tokens)
         lexical_scores = _lexical_prefilter(answer_set, candidates, idf)
 
-        embed_start = time.perf_counter()
-        query_vector: list[float] | None = None
-        if embedding_cache is not None:
-            query_vector = embedding_cache.get_vector(span_index)
-        embedding_time = (time.perf_counter() - embed_start) * 1000
-
         selected = _select_candidates(
             candidates,
             lexical_scores=lexical_scores,
-            embedding_index=embedding_index,
-            query_vector=query_vector,
+            embedding_hits=embedding_hits,
             cfg=cfg,
         )
 
+        prune_disjoint = _aligner_skips_disjoint(aligner)
         align_start = time.perf_counter()
         for candidate_index, embed_score, lexical_score in selected:
             candidate = candidates[candidate_index]
-            alignment = aligner.align(answer_tokens, candidate.token_ids)
-            num_alignments += 1
+            if prune_disjoint and answer_set.isdisjoint(candidate.token_set):
+                alignment = _EMPTY_ALIGNMENT
+            else:
+                alignment = aligner.align(answer_tokens, candidate.token_ids)
+                num_alignments += 1
 
             citation = _process_candidate(
                 candidate=candidate,
@@ -329,8 +529,11 @@ def _process_answer_span(
                 lexical_score=lexical_score,
                 cfg=cfg,
             )
-            if citation is not None:
-                citations.append(citation)
+            if citation is None:
+                continue
+            citations.append(citation)
+            if _clears_early_exit(citation, cfg):
+                break
         alignment_time = (time.perf_counter() - align_start) * 1000
 
     citations = _rank_and_limit_citations(citations, cfg)
@@ -341,7 +544,6 @@ def _process_answer_span(
             answer_span=answer_span, citations=citations, status=status
         ),
         num_alignments=num_alignments,
-        embedding_time_ms=embedding_time,
         alignment_time_ms=alignment_time,
     )
 
@@ -391,6 +593,12 @@ def _process_candidate(
     )
 
 
+def _clears_early_exit(citation: Citation, cfg: CitationConfig) -> bool:
+    """Check whether `citation` is strong enough to stop scoring candidates."""
+    threshold = cfg.early_exit_answer_coverage
+    return threshold is not None and citation.components["answer_coverage"] >= threshold
+
+
 def _compute_alignment_metrics(
     alignment: Alignment, answer_tokens: list[int], cfg: CitationConfig
 ) -> dict[str, float]:
@@ -511,6 +719,7 @@ def _default_aligner(cfg: CitationConfig, *, backend: str) -> Aligner:
             mismatch_score=cfg.mismatch_score,
             gap_score=cfg.gap_score,
             return_match_blocks=cfg.multi_span_evidence,
+            band_width=cfg.alignment_band_width,
         )
     if backend == "rust":
         return RustSmithWatermanAligner(
@@ -534,9 +743,33 @@ def _default_aligner(cfg: CitationConfig, *, backend: str) -> Aligner:
             mismatch_score=cfg.mismatch_score,
             gap_score=cfg.gap_score,
             return_match_blocks=cfg.multi_span_evidence,
+            band_width=cfg.alignment_band_width,
         )
 
 
+def _aligner_skips_disjoint(aligner: Aligner) -> bool:
+    """Check whether `aligner` is known to score disjoint token sets as zero.
+
+    True for the built-in Smith-Waterman aligners when mismatches and gaps
+    cannot add to a score. Candidates sharing no token with the answer span
+    can then skip alignment using their precomputed token sets.
+    """
+    if not isinstance(aligner, (SmithWatermanAligner, RustSmithWatermanAligner)):
+        return False
+    return aligner.mismatch_score <= 0 and aligner.gap_score <= 0
+
+
+def _aligner_releases_gil(aligner: Aligner) -> bool:
+    """Check whether `aligner` does its heavy work without holding the GIL.
+
+    True for the Rust aligner and for the Python aligner when its numba
+    kernels are available. Aligning spans on threads only pays off for these.
+    """
+    if isinstance(aligner, RustSmithWatermanAligner):
+        return True
+    return isinstance(aligner, SmithWatermanAligner) and aligner_numba.NUMBA_AVAILABLE
+
+
 def _normalize_sources(
     sources: Sequence[str | SourceDocument | SourceChunk],
 ) -> list[_NormalizedSource]:
@@ -583,10 +816,11 @@ def _build_source_passages(
     cfg: CitationConfig,
 ) -> list[tuple[_NormalizedSource, list[Passage]]]:
     output: list[tuple[_NormalizedSource, list[Passage]]] = []
-    for source in sources:
-        passages = generate_passages(
+    texts = [source.text for source in sources]
+    for source, segments in zip(sources, _segment_texts(segmenter, texts), strict=True):
+        passages = passages_from_segments(
             source.text,
-            segmenter=segmenter,
+            segments,
             window_size_sentences=cfg.window_size_sentences,
             window_stride_sentences=cfg.window_stride_sentences,
         )
@@ -594,27 +828,47 @@ def _build_source_passages(
     return output
 
 
+def _segment_texts(segmenter: Segmenter, texts: list[str]) -> list[list[Segment]]:
+    """Segment all texts, in one batch when the segmenter supports it."""
+    batch_segment = getattr(segmenter, "batch_segment", None)
+    if batch_segment is not None and texts:
+        return batch_segment(texts)
+    return [segmenter.segment(text) for text in texts]
+
+
+def _tokenize_texts(tokenizer: Tokenizer, texts: list[str]) -> list[TokenizedText]:
+    """Tokenize all texts, in one batch when the tokenizer supports it."""
+    batch_tokenize = getattr(tokenizer, "batch_tokenize", None)
+    if batch_tokenize is not None and texts:
+        return batch_tokenize(texts)
+    return [tokenizer.tokenize(text) for text in texts]
+
+
 def _build_candidates(
     source_passages: Sequence[tuple[_NormalizedSource, list[Passage]]],
     tokenizer: Tokenizer,
 ) -> list[_Candidate]:
-    candidates: list[_Candidate] = []
-    global_index = 0
-    for source, passages in source_passages:
-        for passage in passages:
-            tokenized = tokenizer.tokenize(passage.text)
-            candidates.append(
-                _Candidate(
-                    global_index=global_index,
-                    source=source,
-                    passage=passage,
-                    token_ids=tokenized.token_ids,
-                    token_spans=tokenized.token_spans,
-                    token_set=frozenset(tokenized.token_ids),
-                )
-            )
-            global_index += 1
-    return candidates
+    pairs = [
+        (source, passage)
+        for source, passages in source_passages
+        for passage in passages
+    ]
+    tokenized_passages = _tokenize_texts(
+        tokenizer, [passage.text for _, passage in pairs]
+    )
+    return [
+        _Candidate(
+            global_index=global_index,
+            source=source,
+            passage=passage,
+            token_ids=tokenized.token_ids,
+            token_spans=tokenized.token_spans,
+            token_set=frozenset(tokenized.token_ids),
+        )
+        for global_index, ((source, passage), tokenized) in enumerate(
+            zip(pairs, tokenized_passages, strict=True)
+        )
+    ]
 
 
 def _compute_idf(candidates: Sequence[_Candidate]) -> IdfWeights:
@@ -654,14 +908,13 @@ def _select_candidates(
     candidates: Sequence[_Candidate],
     *,
     lexical_scores: LexicalScores,
-    embedding_index: EmbeddingIndex | None,
-    query_vector: list[float] | None,
+    embedding_hits: EmbeddingHits,
     cfg: CitationConfig,
 ) -> CandidateSelection:
     selected: dict[int, tuple[float, float]] = {}
 
     _add_lexical_candidates(selected, candidates, lexical_scores, cfg)
-    _add_embedding_candidates(selected, embedding_index, query_vector, cfg)
+    _add_embedding_candidates(selected, embedding_hits)
 
     return _rank_selected_candidates(selected, candidates, cfg)
 
@@ -685,18 +938,10 @@ def _add_lexical_candidates(
 
 def _add_embedding_candidates(
     selected: dict[int, tuple[float, float]],
-    embedding_index: EmbeddingIndex | None,
-    query_vector: list[float] | None,
-    cfg: CitationConfig,
+    embedding_hits: EmbeddingHits,
 ) -> None:
     """Add top embedding candidates to the selected set."""
-    if (
-        cfg.max_candidates_embedding <= 0
-        or query_vector is None
-        or embedding_index is None
-    ):
-        return
-    for idx, score in embedding_index.top_k(query_vector, cfg.max_candidates_embedding):
+    for idx, score in embedding_hits:
         prev = selected.get(idx)
         lexical_score = 0.0 if prev is None else prev[1]
         selected[idx] = (score, lexical_score)
@@ -0,0 +1,127 @@
+"""Numba kernels for the Python Smith-Waterman aligner.
+
+The kernels are compiled with `numba.njit` when numba is installed. Without
+numba they remain plain Python functions, and `SmithWatermanAligner` uses its
+NumPy implementation instead. Compiled kernels release the GIL, so aligners
+used from several threads run their fills concurrently.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, TypeVar
+
+import numpy as np
+import numpy.typing as npt
+
+try:
+    import numba  # pyright: ignore[reportMissingImports]
+except ImportError:  # pragma: no cover - optional dependency
+    numba = None
+
+NUMBA_AVAILABLE: bool = numba is not None
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+# Traceback directions stored in the direction matrix.
+STOP = 0
+DIAGONAL = 1
+UP = 2
+LEFT = 3
+
+
+def _jit(func: _F) -> _F:
+    if numba is None:
+        return func
+    return numba.njit(cache=True, boundscheck=False, nogil=True)(func)
+
+
+@_jit
+def fill_matrix(
+    seq1: npt.NDArray[np.int64],
+    seq2: npt.NDArray[np.int64],
+    match_score: int,
+    mismatch_score: int,
+    gap_score: int,
+    scores: npt.NDArray[np.int32],
+    directions: npt.NDArray[np.uint8],
+    band_width: int,
+) -> int:
+    """Fill zero-initialized score and direction matrices in place.
+
+    A positive `band_width` restricts each row to the columns within that
+    distance of the scaled main diagonal (matching `aligner_py._band_limits`);
+    0 fills the full matrix.
+
+    Returns:
+        The maximum score in the matrix (0 if no cell scored positively).
+    """
+    rows, cols = scores.shape
+    max_score = 0
+    lo = 1
+    hi = cols
+    for i in range(1, rows):
+        if band_width > 0:
+            center = i * cols // rows
+            lo = max(1, center - band_width)
+            hi = min(cols, center + band_width + 1)
+        token = seq1[i - 1]
+        prev_row = scores[i - 1]
+        row = scores[i]
+        direction_row = directions[i]
+        for j in range(lo, hi):
+            score_diag = prev_row[j - 1] + (
+                match_score if token == seq2[j - 1] else mismatch_score
+            )
+            score_up = prev_row[j] + gap_score
+            score_left = row[j - 1] + gap_score
+
+            if score_diag >= score_up and score_diag >= score_left:
+                best = score_diag
+                direction = DIAGONAL
+            elif score_up >= score_left:
+                best = score_up
+                direction = UP
+            else:
+                best = score_left
+                direction = LEFT
+            if best <= 0:
+                continue
+            row[j] = best
+            direction_row[j] = direction
+            if best > max_score:
+                max_score = best
+    return max_score
+
+
+@_jit
+def traceback(
+    directions: npt.NDArray[np.uint8],
+    scores: npt.NDArray[np.int32],
+    seq1: npt.NDArray[np.int64],
+    seq2: npt.NDArray[np.int64],
+    i: int,
+    j: int,
+    match_positions: npt.NDArray[np.int64],
+) -> tuple[int, int, int]:
+    """Trace back from `(i, j)` to the start of the local alignment.
+
+    Matched `seq2` positions are written to `match_positions` in traceback
+    (descending) order; its length must be at least `min(i, j)`.
+
+    Returns:
+        Tuple of (i_start, j_start, matches).
+    """
+    matches = 0
+    while i > 0 and j > 0 and directions[i, j] != STOP and scores[i, j] > 0:
+        direction = directions[i, j]
+        if direction == DIAGONAL:
+            i -= 1
+            j -= 1
+            if seq1[i] == seq2[j]:
+                match_positions[matches] = j
+                matches += 1
+        elif direction == UP:
+            i -= 1
+        else:
+            j -= 1
+    return i, j, matches
@@ -2,19 +2,26 @@
 
 from __future__ import annotations
 
-from enum import IntEnum
-from typing import Sequence
+import threading
+from typing import Any, Callable, Sequence, TypeAlias
 
+import numpy as np
+import numpy.typing as npt
+
+from cite_right.core import aligner_numba
+from cite_right.core.aligner_numba import DIAGONAL, LEFT, STOP, UP
 from cite_right.core.results import Alignment
 
+_PARASAIL_ALPHABET = "".join(chr(code) for code in range(33, 127))
+"""Printable symbols used to encode token IDs for parasail.
+
+Query tokens are assigned symbols in order of first appearance; the last symbol
+is reserved for target tokens that never occur in the query.
+"""
 
-class Direction(IntEnum):
-    """Direction constants for Smith-Waterman traceback."""
 
-    STOP = 0
-    DIAGONAL = 1
-    UP = 2
-    LEFT = 3
+_Traceback: TypeAlias = Callable[..., tuple[int, int, int, list[tuple[int, int]]]]
+"""Traceback function returning (i_start, j_start, matches, match_blocks)."""
 
 
 class SmithWatermanAligner:
@@ -27,6 +34,16 @@ class SmithWatermanAligner:
         return_match_blocks: If True, populate `Alignment.match_blocks` with token
             index ranges in `seq2` that correspond to contiguous runs of exact
             matches in the selected alignment.
+        band_width: If set, only fill cells within this many columns of the
+            scaled main diagonal (`j ≈ i * len(seq2) / len(seq1)`). The band is
+            doubled and the fill repeated while a cell on its edge scores
+            positively. This trades recall for speed: matches that never reach
+            the band are missed. None (default) fills the full matrix.
+
+    When the optional `numba` package is installed, the matrix fill and
+    traceback run as compiled kernels. Otherwise, if `parasail` is installed,
+    the score matrix is computed with its striped SIMD kernel, falling back to
+    a vectorized NumPy fill. All paths produce identical alignments.
     """
 
     def __init__(
@@ -36,23 +53,42 @@ class SmithWatermanAligner:
         gap_score: int = -1,
         *,
         return_match_blocks: bool = False,
+        band_width: int | None = None,
     ) -> None:
         self.match_score = match_score
         self.mismatch_score = mismatch_score
         self.gap_score = gap_score
         self.return_match_blocks = return_match_blocks
+        self.band_width = None if band_width is None else max(1, band_width)
+        self._parasail, self._parasail_matrix = _load_parasail(
+            match_score, mismatch_score
+        )
+        self._buffers = threading.local()
+
+    def align(
+        self,
+        seq1: Sequence[int] | npt.NDArray[np.integer],
+        seq2: Sequence[int] | npt.NDArray[np.integer],
+    ) -> Alignment:
+        """Align two token sequences and return the best local alignment.
+
+        The sequences may be lists or NumPy integer arrays; int64 arrays are
+        used by the DP without copying.
+        """
+        if len(seq1) == 0 or len(seq2) == 0:
+            return Alignment(score=0, token_start=0, token_end=0)
 
-    def align(self, seq1: Sequence[int], seq2: Sequence[int]) -> Alignment:
-        """Align two token sequences and return the best local alignment."""
-        if not seq1 or not seq2:
+        query = np.asarray(seq1, dtype=np.int64)
+        target = np.asarray(seq2, dtype=np.int64)
+        seq1_list = query.tolist()
+        seq2_list = target.tolist()
+        if self._cannot_score(seq1_list, seq2_list):
             return Alignment(score=0, token_start=0, token_end=0)
 
-        seq1_list = list(seq1)
-        seq2_list = list(seq2)
+        if aligner_numba.NUMBA_AVAILABLE:
+            return self._align_compiled(query, target)
 
-        scores, directions, max_score, max_positions = self._fill_matrix(
-            seq1_list, seq2_list
-        )
+        scores, directions, max_score, max_positions = self._fill_matrix(query, target)
 
         if max_score == 0:
             return Alignment(score=0, token_start=0, token_end=0)
@@ -61,61 +97,218 @@ class SmithWatermanAligner:
             max_score, max_positions, directions, scores, seq1_list, seq2_list
         )
 
+    def _cannot_score(self, seq1: Sequence[int], seq2: Sequence[int]) -> bool:
+        """Return True if no cell can score positively, so the DP can be skipped.
+
+        With non-positive mismatch and gap scores only exact matches add to a
+        score, so sequences sharing no token always align with score 0.
+        """
+        if self.mismatch_score > 0 or self.gap_score > 0:
+            return False
+        return set(seq1).isdisjoint(seq2)
+
+    def _align_compiled(
+        self, query: npt.NDArray[np.int64], target: npt.NDArray[np.int64]
+    ) -> Alignment:
+        """Align using the numba-compiled fill and traceback kernels."""
+        width = self.band_width
+
+        while True:
+            scores, directions = self._matrices(len(query) + 1, len(target) + 1)
+            max_score = aligner_numba.fill_matrix(
+                query,
+                target,
+                self.match_score,
+                self.mismatch_score,
+                self.gap_score,
+                scores,
+                directions,
+                0 if width is None else width,
+            )
+            if width is None or not _band_edge_scored(scores, width):
+                break
+            width *= 2
+
+        if max_score <= 0:
+            return Alignment(score=0, token_start=0, token_end=0)
+
+        max_positions = [(i, j) for i, j in np.argwhere(scores == max_score).tolist()]
+        return self._select_best_alignment(
+            int(max_score),
+            max_positions,
+            directions,
+            scores,
+            query,
+            target,
+            traceback=_compiled_traceback_details,
+        )
+
     def _fill_matrix(
-        self, seq1: list[int], seq2: list[int]
-    ) -> tuple[list[list[int]], list[list[Direction]], int, list[tuple[int, int]]]:
+        self, query: npt.NDArray[np.int64], target: npt.NDArray[np.int64]
+    ) -> tuple[
+        npt.NDArray[np.int32], npt.NDArray[np.uint8], int, list[tuple[int, int]]
+    ]:
         """Fill the scoring matrix and track maximum positions."""
-        rows = len(seq1) + 1
-        cols = len(seq2) + 1
+        rows = len(query) + 1
+        cols = len(target) + 1
 
-        scores = [[0] * cols for _ in range(rows)]
-        directions = [[Direction.STOP] * cols for _ in range(rows)]
-        max_score = 0
-        max_positions: list[tuple[int, int]] = []
+        substitution = np.where(
+            query[:, None] == target[None, :], self.match_score, self.mismatch_score
+        ).astype(np.int32)
 
-        for i in range(1, rows):
-            for j in range(1, cols):
-                cell_score, direction = self._compute_cell(i, j, seq1, seq2, scores)
-                scores[i][j] = cell_score
-                directions[i][j] = direction
+        scores, directions = self._matrices(rows, cols)
+        if self.band_width is not None:
+            self._banded_scores(substitution, scores, self.band_width)
+        elif not self._parasail_scores(query, target, scores):
+            self._numpy_scores(substitution, scores)
 
-                if cell_score > max_score:
-                    max_score = cell_score
-                    max_positions = [(i, j)]
-                elif cell_score == max_score and cell_score > 0:
-                    max_positions.append((i, j))
+        max_score = int(scores.max())
+        if max_score <= 0:
+            return scores, directions, 0, []
 
+        _choose_directions(scores, substitution, self.gap_score, directions)
+        max_positions = [(i, j) for i, j in np.argwhere(scores == max_score).tolist()]
         return scores, directions, max_score, max_positions
 
-    def _compute_cell(
-        self, i: int, j: int, seq1: list[int], seq2: list[int], scores: list[list[int]]
-    ) -> tuple[int, Direction]:
-        """Compute score and direction for a single matrix cell."""
-        match = self.match_score if seq1[i - 1] == seq2[j - 1] else self.mismatch_score
-        score_diag = scores[i - 1][j - 1] + match
-        score_up = scores[i - 1][j] + self.gap_score
-        score_left = scores[i][j - 1] + self.gap_score
+    def _matrices(
+        self, rows: int, cols: int
+    ) -> tuple[npt.NDArray[np.int32], npt.NDArray[np.uint8]]:
+        """Return zeroed score and direction matrices of shape `(rows, cols)`.
+
+        The matrices are views into per-thread buffers that are reused across
+        `align` calls and grown geometrically, so aligning many windows of
+        similar size does not allocate two fresh matrices every time.
+        """
+        size = rows * cols
+        buffers = self._buffers
+        capacity = getattr(buffers, "capacity", 0)
+        if capacity < size:
+            capacity = max(size, 2 * capacity)
+            buffers.scores = np.empty(capacity, dtype=np.int32)
+            buffers.directions = np.empty(capacity, dtype=np.uint8)
+            buffers.capacity = capacity
+
+        scores = buffers.scores[:size].reshape(rows, cols)
+        directions = buffers.directions[:size].reshape(rows, cols)
+        scores.fill(0)
+        directions.fill(0)
+        return scores, directions
+
+    def _banded_scores(
+        self,
+        substitution: npt.NDArray[np.int32],
+        scores: npt.NDArray[np.int32],
+        width: int,
+    ) -> None:
+        """Fill within a diagonal band, doubling it while its edge scores."""
+        while True:
+            self._numpy_scores(substitution, scores, width)
+            if not _band_edge_scored(scores, width):
+                return
+            width *= 2
+            scores.fill(0)
+
+    def _numpy_scores(
+        self,
+        substitution: npt.NDArray[np.int32],
+        scores: npt.NDArray[np.int32],
+        band_width: int | None = None,
+    ) -> None:
+        """Fill the zeroed score matrix row by row with vectorized NumPy operations.
+
+        The diagonal and vertical moves only depend on the previous row, and the
+        horizontal gap chain `H[j] = max(E[j], H[j - 1] + gap)` unrolls to
+        `j * gap + max(E[k] - k * gap for k <= j)`, i.e. a running maximum.
+        With `band_width`, only the columns within the band are computed and
+        cells outside it stay 0.
+        """
+        rows, cols = scores.shape
+        ramp = np.arange(cols, dtype=np.int32) * np.int32(self.gap_score)
+        best = np.zeros(cols, dtype=np.int32)
+
+        for i in range(1, rows):
+            lo, hi = _band_limits(i, rows, cols, band_width)
+            prev = scores[i - 1]
+            row = best[lo - 1 : hi]
+            np.add(
+                prev[lo - 1 : hi - 1], substitution[i - 1, lo - 1 : hi - 1], out=row[1:]
+            )
+            np.maximum(row[1:], prev[lo:hi] + self.gap_score, out=row[1:])
+            np.maximum(row, 0, out=row)
+            row[0] = 0
+            offsets = ramp[: hi - lo + 1]
+            np.subtract(row, offsets, out=row)
+            np.maximum.accumulate(row, out=row)
+            np.add(row, offsets, out=scores[i, lo - 1 : hi])
+
+    def _parasail_scores(
+        self,
+        query: npt.NDArray[np.int64],
+        target: npt.NDArray[np.int64],
+        scores: npt.NDArray[np.int32],
+    ) -> bool:
+        """Fill the score matrix with parasail's striped kernel, if possible.
+
+        Returns False (leaving `scores` untouched) when parasail is unavailable,
+        the scoring scheme cannot be expressed as a linear gap penalty, the query
+        has too many distinct tokens to encode, or the 16-bit kernel saturated.
+        """
+        if self._parasail is None or self.gap_score >= 0:
+            return False
+
+        seq1 = query.tolist()
+        seq2 = target.tolist()
+        symbols: dict[int, str] = {}
+        for token in seq1:
+            if token not in symbols:
+                symbols[token] = _PARASAIL_ALPHABET[len(symbols)]
+                if len(symbols) >= len(_PARASAIL_ALPHABET):
+                    return False
+
+        other = _PARASAIL_ALPHABET[-1]
+        encoded_query = "".join(symbols[token] for token in seq1)
+        encoded_target = "".join(symbols.get(token, other) for token in seq2)
+
+        gap_penalty = -self.gap_score
+        result = self._parasail.sw_table_striped_16(
+            encoded_query,
+            encoded_target,
+            gap_penalty,
+            gap_penalty,
+            self._parasail_matrix,
+        )
+        if getattr(result, "saturated", False):
+            return False
 
-        best = max(0, score_diag, score_up, score_left)
-        if best <= 0:
-            return 0, Direction.STOP
-        return best, _choose_direction(best, score_diag, score_up, score_left)
+        scores[1:, 1:] = np.asarray(result.score_table, dtype=np.int32)
+        return True
 
     def _select_best_alignment(
         self,
         max_score: int,
         max_positions: list[tuple[int, int]],
-        directions: list[list[Direction]],
-        scores: list[list[int]],
-        seq1: list[int],
-        seq2: list[int],
+        directions: npt.NDArray[np.uint8],
+        scores: npt.NDArray[np.int32],
+        seq1: list[int] | npt.NDArray[np.int64],
+        seq2: list[int] | npt.NDArray[np.int64],
+        *,
+        traceback: _Traceback | None = None,
     ) -> Alignment:
-        """Select the best alignment from all maximum positions."""
+        """Select the best alignment from all maximum positions.
+
+        Ties are broken by `(j_start, -span_len, i_start, j_end, i_end)`.
+        Positions are visited in order of the earliest `j_start` they could
+        reach, so once that bound exceeds the best start found, the remaining
+        positions cannot win and are not traced back.
+        """
+        traceback = traceback or _traceback_details
         best_key: tuple[int, int, int, int, int] | None = None
         best_result: tuple[int, int, int, int, int, list[tuple[int, int]]] | None = None
 
-        for i_end, j_end in max_positions:
-            i_start, j_start, matches, match_blocks = _traceback_details(
+        for floor, i_end, j_end in self._order_by_start_floor(max_score, max_positions):
+            if best_key is not None and floor > best_key[0]:
+                break
+            i_start, j_start, matches, match_blocks = traceback(
                 i_end,
                 j_end,
                 directions,
@@ -141,60 +334,157 @@ class SmithWatermanAligner:
             match_blocks=best_result[5],
         )
 
+    def _order_by_start_floor(
+        self, max_score: int, max_positions: list[tuple[int, int]]
+    ) -> list[tuple[int, int, int]]:
+        """Pair each end position with a lower bound on its `j_start`, sorted.
+
+        A path ending at `(i, j)` takes at most `i` diagonal steps, each adding
+        at most `max(match, mismatch, 0)`, and every horizontal step costs
+        `-gap`. Reaching `max_score` therefore allows at most
+        `(step * i - max_score) // -gap` horizontal steps, which bounds how far
+        left of `j - i` the path can start.
+        """
+        if len(max_positions) == 1:
+            i_end, j_end = max_positions[0]
+            return [(0, i_end, j_end)]
+        if self.gap_score >= 0:
+            return [(0, i_end, j_end) for i_end, j_end in max_positions]
+
+        step = max(self.match_score, self.mismatch_score, 0)
+        penalty = -self.gap_score
+        return sorted(
+            (
+                max(0, j_end - i_end - (step * i_end - max_score) // penalty),
+                i_end,
+                j_end,
+            )
+            for i_end, j_end in max_positions
+        )
+
+
+def _band_limits(
+    i: int, rows: int, cols: int, band_width: int | None
+) -> tuple[int, int]:
+    """Return the half-open column range `[lo, hi)` filled for row `i`."""
+    if band_width is None:
+        return 1, cols
+    center = i * cols // rows
+    return max(1, center - band_width), min(cols, center + band_width + 1)
+
 
-def _choose_direction(
-    best: int, score_diag: int, score_up: int, score_left: int
-) -> Direction:
-    if best == score_diag:
-        return Direction.DIAGONAL
-    if best == score_up:
-        return Direction.UP
-    return Direction.LEFT
+def _band_edge_scored(scores: npt.NDArray[np.int32], band_width: int) -> bool:
+    """Check whether any cell on an inner edge of the band scored positively.
+
+    A positive edge cell means the alignment may continue outside the band, so
+    the band has to be widened for the result to be trusted.
+    """
+    rows, cols = scores.shape
+    if band_width >= cols:
+        return False
+    i = np.arange(1, rows)
+    center = i * cols // rows
+    lo = np.maximum(1, center - band_width)
+    hi = np.minimum(cols, center + band_width + 1)
+    left = scores[i, lo][lo > 1]
+    right = scores[i, hi - 1][hi < cols]
+    return bool(left.any() or right.any())
+
+
+def _load_parasail(match_score: int, mismatch_score: int) -> tuple[Any, Any]:
+    """Import parasail and build its substitution matrix, if installed."""
+    try:
+        import parasail  # pyright: ignore[reportMissingImports]
+    except ImportError:
+        return None, None
+    return parasail, parasail.matrix_create(
+        _PARASAIL_ALPHABET, match_score, mismatch_score
+    )
+
+
+def _choose_directions(
+    scores: npt.NDArray[np.int32],
+    substitution: npt.NDArray[np.int32],
+    gap_score: int,
+    directions: npt.NDArray[np.uint8],
+) -> None:
+    """Derive traceback directions from a filled score matrix.
+
+    Writes into `directions`, whose first row and column must be zero. Ties are
+    broken in the order diagonal, up, left; cells scoring zero stop the
+    traceback.
+    """
+    best = scores[1:, 1:]
+    inner = directions[1:, 1:]
+    inner[:] = LEFT
+    inner[best == scores[:-1, 1:] + gap_score] = UP
+    inner[best == scores[:-1, :-1] + substitution] = DIAGONAL
+    inner[best <= 0] = STOP
 
 
 def _traceback_details(
     i: int,
     j: int,
-    directions: list[list[Direction]],
-    scores: list[list[int]],
+    directions: npt.NDArray[np.uint8],
+    scores: npt.NDArray[np.int32],
     seq1: list[int],
     seq2: list[int],
     *,
     return_match_blocks: bool,
 ) -> tuple[int, int, int, list[tuple[int, int]]]:
-    """Trace back through the alignment matrix to find match details."""
-    matches = 0
+    """Trace back through the alignment matrix to find match details.
+
+    Cells are addressed by their flat offset `i * cols + j` into the contiguous
+    matrices, so each step is a single integer subtraction. Row 0 and column 0
+    always score zero, which bounds the walk.
+    """
+    cols = directions.shape[1]
+    pos = i * cols + j
     match_positions: list[int] = []
 
-    while i > 0 and j > 0 and directions[i][j] != Direction.STOP and scores[i][j] > 0:
-        i, j, is_match = _step_traceback(i, j, directions, seq1, seq2)
-        if is_match:
-            matches += 1
-            if return_match_blocks:
+    while scores.item(pos) > 0:
+        direction = directions.item(pos)
+        if direction == DIAGONAL:
+            i -= 1
+            j -= 1
+            pos -= cols + 1
+            if seq1[i] == seq2[j]:
                 match_positions.append(j)
+        elif direction == UP:
+            i -= 1
+            pos -= cols
+        elif direction == LEFT:
+            j -= 1
+            pos -= 1
+        else:
+            break
 
+    matches = len(match_positions)
     blocks = _consolidate_match_blocks(match_positions) if return_match_blocks else []
     return i, j, matches, blocks
 
 
-def _step_traceback(
+def _compiled_traceback_details(
     i: int,
     j: int,
-    directions: list[list[Direction]],
-    seq1: list[int],
-    seq2: list[int],
-) -> tuple[int, int, bool]:
-    """Take one step in the traceback, returning new position and whether it was a match."""
-    match directions[i][j]:
-        case Direction.DIAGONAL:
-            i -= 1
-            j -= 1
-            return i, j, seq1[i] == seq2[j]
-        case Direction.UP:
-            return i - 1, j, False
-        case Direction.LEFT:
-            return i, j - 1, False
-    return i, j, False  # pragma: no cover
+    directions: npt.NDArray[np.uint8],
+    scores: npt.NDArray[np.int32],
+    seq1: npt.NDArray[np.int64],
+    seq2: npt.NDArray[np.int64],
+    *,
+    return_match_blocks: bool,
+) -> tuple[int, int, int, list[tuple[int, int]]]:
+    """Trace back with the compiled kernel; mirrors `_traceback_details`."""
+    match_positions = np.empty(min(i, j), dtype=np.int64)
+    i, j, matches = aligner_numba.traceback(
+        directions, scores, seq1, seq2, i, j, match_positions
+    )
+    blocks = (
+        _consolidate_match_blocks(match_positions[:matches].tolist())
+        if return_match_blocks
+        else []
+    )
+    return int(i), int(j), int(matches), blocks
 
 
 def _consolidate_match_blocks(match_positions: list[int]) -> list[tuple[int, int]]:
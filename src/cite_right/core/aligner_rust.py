@@ -65,6 +65,14 @@ class RustSmithWatermanAligner:
             AttributeError: If required alignment methods are not present in the Rust extension.
                 In general, this is suppressed; the function will try less-detailed versions.
         """
+        if (
+            self.mismatch_score <= 0
+            and self.gap_score <= 0
+            and set(seq1).isdisjoint(seq2)
+        ):
+            # Only exact matches can score, so skip the conversion and DP.
+            return Alignment(score=0, token_start=0, token_end=0)
+
         if self.return_match_blocks:
             with suppress(AttributeError):
                 (
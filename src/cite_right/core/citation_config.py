@@ -26,6 +26,16 @@ class CitationConfig(BaseModel):
     """Configuration for `cite_right.align_citations`.
 
     Attributes:
+        alignment_band_width: If set, the Python aligner only fills cells within
+            this many tokens of the diagonal (widening the band when an alignment
+            reaches its edge). Faster on long windows, but can miss matches
+            far off the diagonal. None (default) runs the exact alignment. The
+            Rust aligner ignores this setting.
+        early_exit_answer_coverage: If set, stop scoring an answer span's
+            candidates once one yields a citation with at least this
+            answer_coverage. Saves alignments when a strong match ranks early,
+            but later (possibly higher-scoring) candidates are never
+            considered. None (default) scores every candidate.
         multi_span_evidence: If True, attempt to return non-contiguous evidence via
             `Citation.evidence_spans` when alignment indicates multiple disjoint match
             regions. The legacy `Citation.char_start/char_end/evidence` fields remain
@@ -60,6 +70,7 @@ class CitationConfig(BaseModel):
     allow_embedding_only: bool = False
     min_embedding_similarity: float = 0.3
     supported_embedding_similarity: float = 0.6
+    early_exit_answer_coverage: float | None = None
 
     window_size_sentences: int = 1
     window_stride_sentences: int = 1
@@ -75,6 +86,7 @@ class CitationConfig(BaseModel):
     match_score: int = 2
     mismatch_score: int = -1
     gap_score: int = -1
+    alignment_band_width: int | None = None
 
     prefer_source_order: bool = True
 
@@ -0,0 +1,17 @@
+"""Content hashing shared by the pipeline's caches."""
+
+from __future__ import annotations
+
+import hashlib
+
+
+def text_digest(text: str) -> bytes:
+    """Return a compact, collision-resistant cache key for `text`.
+
+    Args:
+        text (str): The text to hash.
+
+    Returns:
+        bytes: The 16-byte BLAKE2b digest of the UTF-8 encoded text.
+    """
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
@@ -14,6 +14,11 @@ class Tokenizer(Protocol):
     Methods:
         tokenize(text): Tokenizes the input text into tokens and character spans.
 
+    Tokenizers backed by a native batch API may also define
+    `batch_tokenize(texts)`, returning one TokenizedText per text.
+    `align_citations` uses it for passages and answer spans when present. It
+    is optional and not part of the protocol check.
+
     Example:
         >>> tokenizer: Tokenizer
         >>> result = tokenizer.tokenize("Example sentence.")
@@ -38,6 +43,11 @@ class Segmenter(Protocol):
     Methods:
         segment(text): Splits the input text into segments.
 
+    Segmenters that can process several texts more efficiently at once (e.g.
+    with spaCy's `nlp.pipe`) may also define `batch_segment(texts)`, returning
+    one list of segments per text. `align_citations` uses it for the sources
+    when present. It is optional and not part of the protocol check.
+
     Example:
         >>> segmenter: Segmenter
         >>> segments = segmenter.segment("Sentence one. Sentence two.")
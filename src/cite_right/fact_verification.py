@@ -11,7 +11,7 @@ from typing import Literal, Sequence
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from cite_right.citations import align_citations
+from cite_right.citations import _align_citations_batch
 from cite_right.claims import (
     Claim,
     ClaimDecomposer,
@@ -19,7 +19,12 @@ from cite_right.claims import (
 )
 from cite_right.core.citation_config import CitationConfig
 from cite_right.core.interfaces import AnswerSegmenter, Segmenter, Tokenizer
-from cite_right.core.results import Citation, SourceChunk, SourceDocument
+from cite_right.core.results import (
+    Citation,
+    SourceChunk,
+    SourceDocument,
+    SpanCitations,
+)
 from cite_right.models.base import Embedder
 from cite_right.text.answer_segmenter import SimpleAnswerSegmenter
 
@@ -33,7 +38,8 @@ class FactVerificationConfig(BaseModel):
         partial_coverage_threshold: Minimum answer_coverage for a claim
             to be considered "partial". Below this is "unverified". Default 0.3.
         citation_config: Configuration passed to align_citations.
-            If None, uses default CitationConfig.
+            If None, uses a CitationConfig that stops scoring a claim's
+            candidates once one reaches verified_coverage_threshold.
     """
 
     model_config = ConfigDict(frozen=True)
@@ -121,6 +127,7 @@ def verify_facts(
         top_k=3,
         min_answer_coverage=0.2,
         supported_answer_coverage=cfg.verified_coverage_threshold,
+        early_exit_answer_coverage=cfg.verified_coverage_threshold,
     )
 
     all_claims = _decompose_answer(answer, segmenter, decomposer)
@@ -178,33 +185,42 @@ def _verify_all_claims(
     embedder: Embedder | None,
     backend: Literal["auto", "python", "rust"],
 ) -> FactVerificationMetrics:
-    """Verify all claims and aggregate results."""
-    verifications: list[ClaimVerification] = []
-    verified: list[Claim] = []
-    unverified: list[Claim] = []
-    partial: list[Claim] = []
-    confidence_values: list[float] = []
-
-    for claim in claims:
-        v = _verify_claim(
-            claim=claim,
-            sources=sources,
-            config=cfg,
-            citation_config=citation_config,
-            source_segmenter=source_segmenter,
-            tokenizer=tokenizer,
-            embedder=embedder,
-            backend=backend,
-        )
-        verifications.append(v)
-        confidence_values.append(v.confidence)
-        _categorize_claim(claim, v.status, verified, partial, unverified)
+    """Verify all claims and aggregate results.
+
+    The sources are prepared once and shared by every claim rather than being
+    re-segmented, re-tokenized and re-embedded per claim, and claims with
+    identical text are aligned only once.
+    """
+    unique_texts = list(dict.fromkeys(claim.text for claim in claims))
+    unique_results = _align_citations_batch(
+        unique_texts,
+        sources,
+        config=citation_config,
+        backend=backend,
+        source_segmenter=source_segmenter,
+        tokenizer=tokenizer,
+        embedder=embedder,
+    )
+    results_by_text = dict(zip(unique_texts, unique_results, strict=True))
+
+    verifications = [
+        _verify_claim(claim, results_by_text[claim.text], cfg) for claim in claims
+    ]
+    claims_by_status: dict[str, list[Claim]] = {
+        "verified": [],
+        "partial": [],
+        "unverified": [],
+    }
+    for verification in verifications:
+        claims_by_status[verification.status].append(verification.claim)
+    verified = claims_by_status["verified"]
+    confidence_values = [v.confidence for v in verifications]
 
     return FactVerificationMetrics(
         num_claims=len(claims),
         num_verified=len(verified),
-        num_partial=len(partial),
-        num_unverified=len(unverified),
+        num_partial=len(claims_by_status["partial"]),
+        num_unverified=len(claims_by_status["unverified"]),
         verification_rate=len(verified) / len(claims) if claims else 1.0,
         avg_confidence=sum(confidence_values) / len(confidence_values)
         if confidence_values
@@ -212,53 +228,20 @@ def _verify_all_claims(
         min_confidence=min(confidence_values) if confidence_values else 1.0,
         claim_verifications=verifications,
         verified_claims=verified,
-        unverified_claims=unverified,
-        partial_claims=partial,
+        unverified_claims=claims_by_status["unverified"],
+        partial_claims=claims_by_status["partial"],
     )
 
 
-def _categorize_claim(
-    claim: Claim,
-    status: str,
-    verified: list[Claim],
-    partial: list[Claim],
-    unverified: list[Claim],
-) -> None:
-    """Add claim to the appropriate list based on status."""
-    if status == "verified":
-        verified.append(claim)
-    elif status == "partial":
-        partial.append(claim)
-    else:
-        unverified.append(claim)
-
-
 def _verify_claim(
     claim: Claim,
-    sources: Sequence[str | SourceDocument | SourceChunk],
+    results: Sequence[SpanCitations],
     config: FactVerificationConfig,
-    citation_config: CitationConfig,
-    source_segmenter: Segmenter | None,
-    tokenizer: Tokenizer | None,
-    embedder: Embedder | None,
-    backend: Literal["auto", "python", "rust"],
 ) -> ClaimVerification:
-    """Verify a single claim against sources."""
-    results = align_citations(
-        answer=claim.text,
-        sources=sources,
-        config=citation_config,
-        backend=backend,
-        source_segmenter=source_segmenter,
-        tokenizer=tokenizer,
-        embedder=embedder,
-    )
+    """Verify a single claim from its citation alignment results."""
+    all_citations, best_citation, source_ids = _collect_citations(results)
 
-    all_citations: list[Citation] = []
-    for span_result in results:
-        all_citations.extend(span_result.citations)
-
-    if not all_citations:
+    if best_citation is None:
         return ClaimVerification(
             claim=claim,
             status="unverified",
@@ -268,7 +251,6 @@ def _verify_claim(
             source_ids=[],
         )
 
-    best_citation = max(all_citations, key=lambda c: c.score)
     answer_coverage = float(best_citation.components.get("answer_coverage", 0.0))
 
     if answer_coverage >= config.verified_coverage_threshold:
@@ -278,8 +260,6 @@ def _verify_claim(
     else:
         status = "unverified"
 
-    source_ids = list({c.source_id for c in all_citations})
-
     return ClaimVerification(
         claim=claim,
         status=status,
@@ -288,3 +268,24 @@ def _verify_claim(
         all_citations=all_citations,
         source_ids=source_ids,
     )
+
+
+def _collect_citations(
+    results: Sequence[SpanCitations],
+) -> tuple[list[Citation], Citation | None, list[str]]:
+    """Gather a claim's citations, its best citation and its source IDs.
+
+    Returns:
+        Tuple of (all citations, first highest-scoring citation or None,
+        source IDs in order of first appearance).
+    """
+    all_citations: list[Citation] = []
+    best_citation: Citation | None = None
+    source_ids: dict[str, None] = {}
+    for span_result in results:
+        for citation in span_result.citations:
+            all_citations.append(citation)
+            if best_citation is None or citation.score > best_citation.score:
+                best_citation = citation
+            source_ids[citation.source_id] = None
+    return all_citations, best_citation, list(source_ids)
@@ -113,10 +113,10 @@ def compute_hallucination_metrics(
     if not span_citations:
         return _empty_hallucination_metrics()
 
-    accumulator = _MetricsAccumulator()
+    accumulator = _MetricsAccumulator(cfg)
 
     for sc in span_citations:
-        accumulator.process_span(sc, cfg)
+        accumulator.process_span(sc)
 
     return accumulator.build_metrics(len(span_citations))
 
@@ -145,7 +145,9 @@ def _empty_hallucination_metrics() -> HallucinationMetrics:
 class _MetricsAccumulator:
     """Accumulator for computing hallucination metrics across spans."""
 
-    def __init__(self) -> None:
+    def __init__(self, cfg: HallucinationConfig) -> None:
+        self.weak_citation_threshold = cfg.weak_citation_threshold
+        self.include_partial_in_grounded = cfg.include_partial_in_grounded
         self.span_confidences: list[SpanConfidence] = []
         self.unsupported_spans: list[AnswerSpan] = []
         self.weakly_supported_spans: list[AnswerSpan] = []
@@ -160,16 +162,16 @@ class _MetricsAccumulator:
         self.num_unsupported = 0
         self.num_weak = 0
 
-    def process_span(self, sc: SpanCitations, cfg: HallucinationConfig) -> None:
+    def process_span(self, sc: SpanCitations) -> None:
         """Process a single span citation."""
         span = sc.answer_span
         span_len = len(span.text)
         self.total_chars += span_len
 
-        confidence, best_score, source_ids = self._extract_confidence(sc, cfg)
+        confidence, best_score, source_ids = self._extract_confidence(sc)
         self.confidence_values.append(confidence)
 
-        is_grounded = self._update_status_counts(sc, span_len, cfg)
+        is_grounded = self._update_status_counts(sc, span_len)
 
         if is_grounded:
             self.weighted_confidence_sum += confidence * span_len
@@ -186,25 +188,24 @@ class _MetricsAccumulator:
         )
 
     def _extract_confidence(
-        self, sc: SpanCitations, cfg: HallucinationConfig
+        self, sc: SpanCitations
     ) -> tuple[float, float | None, list[str]]:
         """Extract confidence info from citations."""
-        if not sc.citations:
+        citations = sc.citations
+        if not citations:
             return 0.0, None, []
 
-        best = sc.citations[0]
-        answer_coverage = float(best.components.get("answer_coverage", 0.0))
-        source_ids = list({c.source_id for c in sc.citations})
+        best = citations[0]
+        answer_coverage = best.components.get("answer_coverage", 0.0)
+        source_ids = list(dict.fromkeys(c.source_id for c in citations))
 
-        if answer_coverage < cfg.weak_citation_threshold:
+        if answer_coverage < self.weak_citation_threshold:
             self.num_weak += 1
             self.weakly_supported_spans.append(sc.answer_span)
 
         return answer_coverage, best.score, source_ids
 
-    def _update_status_counts(
-        self, sc: SpanCitations, span_len: int, cfg: HallucinationConfig
-    ) -> bool:
+    def _update_status_counts(self, sc: SpanCitations, span_len: int) -> bool:
         """Update status counts and return whether span is grounded."""
         if sc.status == "supported":
             self.num_supported += 1
@@ -213,7 +214,7 @@ class _MetricsAccumulator:
         if sc.status == "partial":
             self.num_partial += 1
             self.partial_chars += span_len
-            return cfg.include_partial_in_grounded
+            return self.include_partial_in_grounded
         self.num_unsupported += 1
         self.unsupported_chars += span_len
         self.unsupported_spans.append(sc.answer_span)
@@ -11,41 +11,76 @@ To use these integrations, install the optional dependencies:
 
 from __future__ import annotations
 
+import importlib.util
+from functools import lru_cache
 from typing import Any, Sequence
 
 from cite_right.core.results import SourceChunk, SourceDocument
 
-LANGCHAIN_AVAILABLE: bool = False
-LLAMAINDEX_AVAILABLE: bool = False
 
-LangChainDocument: type | None = None
-LlamaIndexTextNode: type | None = None
-LlamaIndexNodeWithScore: type | None = None
-LlamaIndexNode: tuple[type, ...] | None = None
+def _module_available(name: str) -> bool:
+    """Check whether `name` can be imported without importing it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ModuleNotFoundError:
+        return False
+
+
+LANGCHAIN_AVAILABLE: bool = _module_available("langchain_core")
+LLAMAINDEX_AVAILABLE: bool = _module_available("llama_index.core")
+
+# The framework classes are imported on first access (see `__getattr__`), so
+# importing cite_right does not pay for importing LangChain or LlamaIndex.
+LangChainDocument: type | None
+LlamaIndexTextNode: type | None
+LlamaIndexNodeWithScore: type | None
+LlamaIndexNode: tuple[type, ...] | None
 
-try:
-    from langchain_core.documents import Document as _LangChainDocument
 
-    LangChainDocument = _LangChainDocument
-    LANGCHAIN_AVAILABLE = True
-except ImportError:
-    pass
+@lru_cache(maxsize=None)
+def _langchain_document_class() -> type | None:
+    """Import and return LangChain's Document class, or None if unavailable."""
+    if not LANGCHAIN_AVAILABLE:
+        return None
+    try:
+        from langchain_core.documents import Document
+    except ImportError:
+        return None
+    return Document
 
-try:
-    from llama_index.core.schema import NodeWithScore as _LlamaIndexNodeWithScore
-    from llama_index.core.schema import TextNode as _LlamaIndexTextNode
 
-    LlamaIndexTextNode = _LlamaIndexTextNode
-    LlamaIndexNodeWithScore = _LlamaIndexNodeWithScore
-    LlamaIndexNode = (_LlamaIndexTextNode, _LlamaIndexNodeWithScore)
-    LLAMAINDEX_AVAILABLE = True
-except ImportError:
-    pass
+@lru_cache(maxsize=None)
+def _llamaindex_node_classes() -> tuple[type, type] | None:
+    """Import and return LlamaIndex's (TextNode, NodeWithScore) classes."""
+    if not LLAMAINDEX_AVAILABLE:
+        return None
+    try:
+        from llama_index.core.schema import NodeWithScore, TextNode
+    except ImportError:
+        return None
+    return TextNode, NodeWithScore
+
+
+def __getattr__(name: str) -> object:
+    if name == "LangChainDocument":
+        value: object = _langchain_document_class()
+    elif name in ("LlamaIndexTextNode", "LlamaIndexNodeWithScore", "LlamaIndexNode"):
+        node_classes = _llamaindex_node_classes()
+        if node_classes is None:
+            value = None
+        elif name == "LlamaIndexNode":
+            value = node_classes
+        else:
+            value = node_classes[name == "LlamaIndexNodeWithScore"]
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
 
 
 def _require_langchain() -> None:
-    """Raise ImportError if langchain-core is not installed."""
-    if not LANGCHAIN_AVAILABLE:
+    """Raise ImportError if langchain-core is not installed or cannot be imported."""
+    if _langchain_document_class() is None:
         raise ImportError(
             "langchain-core is required for LangChain integration. "
             "Install it with: pip install cite-right[langchain]"
@@ -53,8 +88,8 @@ def _require_langchain() -> None:
 
 
 def _require_llamaindex() -> None:
-    """Raise ImportError if llama-index-core is not installed."""
-    if not LLAMAINDEX_AVAILABLE:
+    """Raise ImportError if llama-index-core is not installed or cannot be imported."""
+    if _llamaindex_node_classes() is None:
         raise ImportError(
             "llama-index-core is required for LlamaIndex integration. "
             "Install it with: pip install cite-right[llamaindex]"
@@ -107,9 +142,8 @@ def is_langchain_document(obj: Any) -> bool:
         >>> if is_langchain_document(doc):
         ...     print(f"Document content: {doc.page_content}")
     """
-    if not LANGCHAIN_AVAILABLE or LangChainDocument is None:
-        return False
-    return isinstance(obj, LangChainDocument)
+    document_class = _langchain_document_class()
+    return document_class is not None and isinstance(obj, document_class)
 
 
 def is_llamaindex_node(obj: Any) -> bool:
@@ -128,11 +162,8 @@ def is_llamaindex_node(obj: Any) -> bool:
         >>> if is_llamaindex_node(node):
         ...     print(f"Node content: {node.get_content()}")
     """
-    if not LLAMAINDEX_AVAILABLE:
-        return False
-    if LlamaIndexTextNode is None or LlamaIndexNodeWithScore is None:
-        return False
-    return isinstance(obj, (LlamaIndexTextNode, LlamaIndexNodeWithScore))
+    node_classes = _llamaindex_node_classes()
+    return node_classes is not None and isinstance(obj, node_classes)
 
 
 def from_langchain_documents(
@@ -169,12 +200,12 @@ def from_langchain_documents(
 
     result: list[SourceDocument] = []
     for idx, doc in enumerate(documents):
-        doc_id = doc.metadata.get(id_key, str(idx))
+        metadata = doc.metadata
         result.append(
             SourceDocument(
-                id=str(doc_id),
+                id=str(metadata.get(id_key, idx)),
                 text=doc.page_content,
-                metadata=doc.metadata,
+                metadata=metadata,
             )
         )
     return result
@@ -220,18 +251,20 @@ def from_langchain_chunks(
 
     result: list[SourceChunk] = []
     for idx, doc in enumerate(documents):
-        doc_id = doc.metadata.get(id_key, str(idx))
-        start = doc.metadata.get(start_key, 0)
-        end = doc.metadata.get(end_key, start + len(doc.page_content))
-        full_text = doc.metadata.get(full_text_key) if full_text_key else None
+        metadata = doc.metadata
+        get = metadata.get
+        text = doc.page_content
+        start = get(start_key, 0)
+        end = get(end_key, start + len(text))
+        full_text = get(full_text_key) if full_text_key else None
 
         result.append(
             SourceChunk(
-                source_id=str(doc_id),
-                text=doc.page_content,
+                source_id=str(get(id_key, idx)),
+                text=text,
                 doc_char_start=start,
                 doc_char_end=end,
-                metadata=doc.metadata,
+                metadata=metadata,
                 document_text=full_text,
                 source_index=idx,
             )
@@ -268,8 +301,7 @@ def from_llamaindex_nodes(
     _require_llamaindex()
 
     result: list[SourceDocument] = []
-    for idx, node in enumerate(nodes):
-        actual_node = getattr(node, "node", node)
+    for idx, actual_node in enumerate(_unwrap_llamaindex_nodes(nodes)):
         content = actual_node.get_content()
         metadata = actual_node.metadata
         doc_id = metadata.get(id_key, str(idx))
@@ -320,8 +352,7 @@ def from_llamaindex_chunks(
     _require_llamaindex()
 
     result: list[SourceChunk] = []
-    for idx, node in enumerate(nodes):
-        actual_node = getattr(node, "node", node)
+    for idx, actual_node in enumerate(_unwrap_llamaindex_nodes(nodes)):
         content = actual_node.get_content()
         metadata = actual_node.metadata
 
@@ -342,6 +373,24 @@ def from_llamaindex_chunks(
     return result
 
 
+def _unwrap_llamaindex_nodes(nodes: Sequence[Any]) -> list[Any]:
+    """Return the TextNode inside each NodeWithScore, passing other nodes through.
+
+    Whether a node wraps another is decided once per node type, so a batch
+    of plain TextNodes does not pay for a failed `node` attribute lookup on
+    every item.
+    """
+    wraps_by_type: dict[type, bool] = {}
+    unwrapped: list[Any] = []
+    for node in nodes:
+        node_type = type(node)
+        wraps = wraps_by_type.get(node_type)
+        if wraps is None:
+            wraps = wraps_by_type[node_type] = hasattr(node, "node")
+        unwrapped.append(node.node if wraps else node)
+    return unwrapped
+
+
 def from_dicts(
     documents: Sequence[dict[str, Any]],
     *,
@@ -365,17 +414,21 @@ def from_dicts(
         >>> sources = from_dicts(docs)
         >>> results = align_citations(answer, sources)
     """
-    result: list[SourceDocument] = []
-    for idx, doc in enumerate(documents):
-        text = doc.get(text_key, "")
-        doc_id = doc.get(id_key, str(idx))
-        metadata = {k: v for k, v in doc.items() if k not in (text_key, id_key)}
-
-        result.append(
-            SourceDocument(
-                id=str(doc_id),
-                text=str(text),
-                metadata=metadata,
-            )
+    return [
+        SourceDocument(
+            id=str(doc.get(id_key, idx)),
+            text=str(doc.get(text_key, "")),
+            metadata=_metadata_without(doc, text_key, id_key),
         )
-    return result
+        for idx, doc in enumerate(documents)
+    ]
+
+
+def _metadata_without(
+    doc: dict[str, Any], text_key: str, id_key: str
+) -> dict[str, Any]:
+    """Return a copy of `doc` without its text and ID entries."""
+    metadata = doc.copy()
+    metadata.pop(text_key, None)
+    metadata.pop(id_key, None)
+    return metadata
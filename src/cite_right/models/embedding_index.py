@@ -15,8 +15,13 @@ class EmbeddingIndex(BaseModel):
     """An index for fast similarity search over embedding vectors.
 
     Attributes:
-        vectors (npt.NDArray[np.float32]): Matrix of embedding vectors, one per text.
-        norms (npt.NDArray[np.float32]): Precomputed L2 norms for each embedding vector.
+        vectors (npt.NDArray[np.float32]): Matrix of L2-normalized embedding
+            vectors, one per text. Zero vectors are kept as zero rows.
+        norms (npt.NDArray[np.float32]): L2 norms of the original embedding
+            vectors; a zero norm marks a vector that never matches.
+
+    Indexes built by `build` or `from_vectors` hold read-only arrays, so the
+    frozen index cannot be modified through them either.
     """
 
     model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
@@ -35,9 +40,28 @@ class EmbeddingIndex(BaseModel):
         Returns:
             EmbeddingIndex: Index containing the embeddings and their norms.
         """
-        raw_vectors = embedder.encode(texts)
+        return cls.from_vectors(embedder.encode(texts))
+
+    @classmethod
+    def from_vectors(cls, raw_vectors: Sequence[Sequence[float]]) -> "EmbeddingIndex":
+        """Build an EmbeddingIndex from already computed embedding vectors.
+
+        Args:
+            raw_vectors (Sequence[Sequence[float]]): One embedding vector per text.
+
+        Returns:
+            EmbeddingIndex: Index containing the embeddings and their norms.
+        """
+        if not len(raw_vectors):
+            return cls(
+                vectors=np.empty((0, 0), dtype=np.float32),
+                norms=np.empty(0, dtype=np.float32),
+            )
         vectors = np.array(raw_vectors, dtype=np.float32)
         norms = np.linalg.norm(vectors, axis=1).astype(np.float32)
+        vectors /= np.maximum(norms, np.finfo(np.float32).tiny)[:, None]
+        vectors.setflags(write=False)
+        norms.setflags(write=False)
         return cls(vectors=vectors, norms=norms)
 
     def top_k(self, query_vector: list[float], k: int) -> list[tuple[int, float]]:
@@ -54,24 +78,56 @@ class EmbeddingIndex(BaseModel):
             list[tuple[int, float]]: List of (index, similarity score) sorted descending.
                 The score is a float in [-1, 1], where 1 is most similar.
         """
-        if k <= 0:
-            return []
-
-        query = np.array(query_vector, dtype=np.float32)
-        query_norm = np.linalg.norm(query)
-        if query_norm == 0.0:
-            return []
-
-        dots = np.dot(self.vectors, query)
-        valid_mask = self.norms > 0
-        scores = np.zeros_like(dots)
-        scores[valid_mask] = dots[valid_mask] / (self.norms[valid_mask] * query_norm)
-
-        sort_keys = list(enumerate(scores))
-        sort_keys.sort(key=lambda item: (-item[1], item[0]))
-
-        results: list[tuple[int, float]] = []
-        for idx, score in sort_keys[:k]:
-            if self.norms[idx] > 0:
-                results.append((idx, float(score)))
-        return results
+        return self.top_k_many([query_vector], k)[0]
+
+    def top_k_many(
+        self,
+        query_vectors: Sequence[Sequence[float]] | npt.NDArray[np.floating],
+        k: int,
+    ) -> list[list[tuple[int, float]]]:
+        """Find the top-k most similar vectors for each of several query vectors.
+
+        The index vectors are stored normalized, so after normalizing the
+        queries all cosine similarities come from a single matrix product:
+        one BLAS call rather than one per query.
+
+        Args:
+            query_vectors (Sequence[Sequence[float]] | npt.NDArray[np.floating]): The
+                embedding vectors to query with, as lists or a 2-D array.
+            k (int): The maximum number of top matches to return per query.
+
+        Returns:
+            list[list[tuple[int, float]]]: For each query, the `top_k` result.
+        """
+        if k <= 0 or len(query_vectors) == 0 or not self.norms.size:
+            return [[] for _ in query_vectors]
+
+        queries = np.array(query_vectors, dtype=np.float32)
+        query_norms = np.linalg.norm(queries, axis=1)
+        queries /= np.where(query_norms > 0, query_norms, 1.0)[:, None]
+        scores = queries @ self.vectors.T
+
+        return [
+            self._rank(row, k) if query_norm > 0 else []
+            for row, query_norm in zip(scores, query_norms, strict=True)
+        ]
+
+    def _rank(self, scores: npt.NDArray[np.float32], k: int) -> list[tuple[int, float]]:
+        """Return the k best (index, score) pairs, skipping zero-norm vectors.
+
+        Ties are broken by ascending index. Only the entries scoring at least
+        the k-th best score are sorted, so ranking is linear in the index
+        size rather than a full sort; for k=1 a single argmax suffices.
+        """
+        if k == 1:
+            best = int(np.argmax(scores))
+            return [(best, float(scores[best]))] if self.norms[best] > 0 else []
+        if k < scores.size:
+            threshold = np.partition(scores, scores.size - k)[scores.size - k]
+            candidates = np.flatnonzero(scores >= threshold)
+        else:
+            candidates = np.arange(scores.size)
+        order = np.argsort(-scores[candidates], kind="stable")
+        top = candidates[order[:k]]
+        top = top[self.norms[top] > 0]
+        return list(zip(top.tolist(), scores[top].tolist(), strict=True))
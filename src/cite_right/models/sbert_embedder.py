@@ -2,17 +2,51 @@
 
 from __future__ import annotations
 
-from typing import Sequence
+import threading
+from collections import OrderedDict
+from typing import Any, Iterable, Literal, Mapping, Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from cite_right.core.hashing import text_digest
 
 
 class SentenceTransformerEmbedder:
-    """SentenceTransformer embedder for the citation alignment pipeline."""
+    """SentenceTransformer embedder for the citation alignment pipeline.
+
+    Embeddings are cached by a hash of the text with least-recently-used
+    eviction, so texts seen in earlier `encode` calls (e.g. the same sources
+    across requests) are not re-encoded. The cache is guarded by a lock, so
+    one instance can be shared between threads.
+    """
 
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2") -> None:
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        *,
+        cache_size: int = 4096,
+        batch_size: int = 64,
+        device: str | None = None,
+        backend: Literal["torch", "onnx", "openvino"] = "torch",
+        model_kwargs: Mapping[str, Any] | None = None,
+    ) -> None:
         """Initialize the SentenceTransformerEmbedder.
 
         Args:
             model_name (str): The name of the SentenceTransformer model to use.
+            cache_size (int): Maximum number of cached text embeddings. 0 disables
+                the cache. Each entry holds one float32 vector, about 3 KB for a
+                768-dimensional model, so the default takes about 13 MB.
+            batch_size (int): Number of texts encoded per model forward pass.
+            device (str | None): Device to run the model on (e.g. "cpu" or
+                "cuda"). None lets sentence-transformers pick one.
+            backend (Literal["torch", "onnx", "openvino"]): Inference backend.
+                "onnx" and "openvino" need sentence-transformers 3.2 or newer
+                with the matching extra installed.
+            model_kwargs (Mapping[str, Any] | None): Extra keyword arguments for
+                loading the model, e.g. `{"file_name": ...}` to pick a quantized
+                ONNX export.
 
         Raises:
             RuntimeError: If sentence-transformers is not installed.
@@ -27,16 +61,78 @@ class SentenceTransformerEmbedder:
                 "Install with 'cite-right[embeddings]'."
             ) from exc
 
-        self._model = SentenceTransformer(model_name)
+        load_kwargs: dict[str, Any] = {}
+        if backend != "torch":
+            load_kwargs["backend"] = backend
+        if model_kwargs:
+            load_kwargs["model_kwargs"] = dict(model_kwargs)
+        self._model = SentenceTransformer(model_name, device=device, **load_kwargs)
+        self._batch_size = batch_size
+        self._cache_size = max(0, cache_size)
+        self._cache: OrderedDict[bytes, npt.NDArray[np.float32]] = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     def encode(self, texts: Sequence[str]) -> list[list[float]]:
         """Encode a list of text strings into a list of float vectors.
 
+        Texts missing from the cache are deduplicated and encoded in a single
+        model call, which sorts them by length into `batch_size` batches.
+        Cached vectors are stored as read-only float32 rows and every returned
+        vector is a new list, so callers may modify the results in place.
+
         Args:
             texts (Sequence[str]): The text strings to encode.
 
         Returns:
             list[list[float]]: List of float vectors for each input text.
         """
-        embeddings = self._model.encode(list(texts))
-        return embeddings.tolist()
+        keys = [text_digest(text) for text in texts]
+        vectors: dict[bytes, npt.NDArray[np.float32]] = {}
+        with self._cache_lock:
+            for key in keys:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    vectors[key] = cached
+
+        missing = {
+            key: text
+            for key, text in zip(keys, texts, strict=True)
+            if key not in vectors
+        }
+        if missing:
+            embeddings = self._model.encode(
+                list(missing.values()),
+                batch_size=self._batch_size,
+                convert_to_numpy=True,
+                show_progress_bar=False,
+            )
+            encoded = {
+                key: _frozen_row(embedding)
+                for key, embedding in zip(missing, embeddings, strict=True)
+            }
+            vectors.update(encoded)
+            self._remember(encoded.items())
+
+        return [vectors[key].tolist() for key in keys]
+
+    def _remember(self, items: Iterable[tuple[bytes, npt.NDArray[np.float32]]]) -> None:
+        """Add new embeddings to the cache, evicting the least recently used."""
+        if not self._cache_size:
+            return
+        with self._cache_lock:
+            for key, vector in items:
+                self._cache[key] = vector
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+
+def _frozen_row(embedding: npt.NDArray[Any]) -> npt.NDArray[np.float32]:
+    """Copy one embedding into its own read-only float32 array.
+
+    The copy lets an evicted row free its memory instead of keeping the whole
+    batch matrix it was sliced from alive.
+    """
+    row = np.array(embedding, dtype=np.float32)
+    row.setflags(write=False)
+    return row
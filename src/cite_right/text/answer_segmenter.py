@@ -5,7 +5,7 @@ from __future__ import annotations
 import re
 
 from cite_right.core.results import AnswerSpan
-from cite_right.text.segmenter_simple import SimpleSegmenter
+from cite_right.text.segmenter_simple import SimpleSegmenter, _trim_span
 
 
 class SimpleAnswerSegmenter:
@@ -90,29 +90,3 @@ def _iter_paragraph_spans(text: str) -> list[tuple[int, int]]:
         spans.append(paragraph)
 
     return spans
-
-
-def _trim_span(text: str, start: int, end: int) -> tuple[int, int] | None:
-    """Trims leading/trailing whitespace from a substring range.
-
-    Args:
-        text (str): The full text.
-        start (int): Start character index (inclusive).
-        end (int): End character index (exclusive).
-
-    Returns:
-        tuple[int, int] | None: Returns (trimmed_start, trimmed_end) if the
-            span is non-empty after trimming, otherwise None.
-    """
-    if start >= end:
-        return None
-    snippet = text[start:end]
-    if not snippet.strip():
-        return None
-    left_trim = len(snippet) - len(snippet.lstrip())
-    right_trim = len(snippet) - len(snippet.rstrip())
-    trimmed_start = start + left_trim
-    trimmed_end = end - right_trim
-    if trimmed_start >= trimmed_end:
-        return None
-    return trimmed_start, trimmed_end
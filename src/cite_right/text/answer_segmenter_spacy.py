@@ -2,10 +2,35 @@
 
 from __future__ import annotations
 
-import re
+from typing import Literal, Sequence
 
 from cite_right.core.results import AnswerSpan
-from cite_right.text.segmenter_spacy import _split_sentence
+from cite_right.text.answer_segmenter import _iter_paragraph_spans
+from cite_right.text.segmenter_simple import _trim_span
+from cite_right.text.segmenter_spacy import (
+    CLAUSE_PIPELINE_EXCLUDE,
+    _load_pipeline,
+    _split_sentence,
+)
+
+SENTENCE_PIPELINE_EXCLUDE: tuple[str, ...] = (
+    "ner",
+    "lemmatizer",
+    "attribute_ruler",
+    "tagger",
+)
+"""Components excluded by default when only sentences are needed.
+
+Sentence boundaries come from the dependency parser, which does not depend on
+the tagger, so tags, entities and lemmas are skipped.
+"""
+
+SENTER_PIPELINE_EXCLUDE: tuple[str, ...] = (*SENTENCE_PIPELINE_EXCLUDE, "parser")
+"""Components excluded by default when sentences come from the `senter`.
+
+The statistical sentence recognizer replaces the dependency parser, so the
+parser is skipped as well.
+"""
 
 
 class SpacyAnswerSegmenter:
@@ -17,6 +42,8 @@ class SpacyAnswerSegmenter:
     Attributes:
         _nlp: The loaded spaCy language model.
         _split_clauses: Whether to split sentences into clauses.
+        _batch_size: Number of paragraphs per `nlp.pipe` batch.
+        _n_process: Number of processes for `nlp.pipe`.
     """
 
     def __init__(
@@ -24,32 +51,51 @@ class SpacyAnswerSegmenter:
         model: str = "en_core_web_sm",
         *,
         split_clauses: bool = False,
+        sentence_boundaries: Literal["parser", "senter"] = "parser",
+        exclude: Sequence[str] | None = None,
+        batch_size: int = 64,
+        n_process: int = 1,
     ) -> None:
         """Initializes the SpacyAnswerSegmenter.
 
         Args:
             model (str, optional): The spaCy language model name to use. Defaults to "en_core_web_sm".
             split_clauses (bool, optional): If True, additionally split sentences into clauses. Defaults to False.
+            sentence_boundaries (Literal["parser", "senter"], optional): Component
+                that detects sentence boundaries. "senter" enables the pipeline's
+                statistical sentence recognizer, which is much faster than the
+                dependency parser but slightly less accurate. Clause splitting
+                needs the parser. Defaults to "parser".
+            exclude (Sequence[str] | None, optional): Pipeline components not to load.
+                Defaults to `CLAUSE_PIPELINE_EXCLUDE` when splitting clauses,
+                `SENTER_PIPELINE_EXCLUDE` with the "senter" and
+                `SENTENCE_PIPELINE_EXCLUDE` otherwise; pass an empty sequence to
+                load the full pipeline.
+            batch_size (int, optional): Number of paragraphs spaCy processes per
+                batch. Defaults to 64.
+            n_process (int, optional): Number of processes for `nlp.pipe`.
+                Defaults to 1.
 
         Raises:
             RuntimeError: If spaCy or the specified model is not installed.
+            ValueError: If the "senter" is combined with clause splitting.
         """
-        try:
-            import spacy  # pyright: ignore[reportMissingImports]
-        except ImportError as exc:  # pragma: no cover - import guard
-            raise RuntimeError(
-                "spaCy is not installed. Install with 'cite-right[spacy]'."
-            ) from exc
-
-        try:
-            self._nlp = spacy.load(model)
-        except OSError as exc:  # pragma: no cover - model guard
-            raise RuntimeError(
-                f"spaCy model '{model}' is not installed. "
-                "Run: python -m spacy download en_core_web_sm"
-            ) from exc
-
+        use_senter = sentence_boundaries == "senter"
+        if use_senter and split_clauses:
+            raise ValueError("Clause splitting requires sentence_boundaries='parser'")
+        if exclude is None:
+            if split_clauses:
+                exclude = CLAUSE_PIPELINE_EXCLUDE
+            elif use_senter:
+                exclude = SENTER_PIPELINE_EXCLUDE
+            else:
+                exclude = SENTENCE_PIPELINE_EXCLUDE
+        self._nlp = _load_pipeline(model, exclude)
+        if use_senter:
+            self._nlp.enable_pipe("senter")
         self._split_clauses = split_clauses
+        self._batch_size = batch_size
+        self._n_process = n_process
 
     def segment(self, text: str) -> list[AnswerSpan]:
         """Segments the input text into answer spans (sentences or clauses).
@@ -62,19 +108,22 @@ class SpacyAnswerSegmenter:
                 or clauses, including their character offsets and labels.
 
         Notes:
-            Paragraphs are identified by two or more consecutive line breaks.
-            If `split_clauses` is enabled, sentences are further split using
+            Paragraphs are identified by two or more consecutive line breaks
+            and parsed together in one `nlp.pipe` pass. If `split_clauses` is enabled, sentences are further split using
             `_split_sentence`.
         """
         spans: list[AnswerSpan] = []
         sentence_index = 0
 
-        for paragraph_index, (para_start, para_end) in enumerate(
-            _iter_paragraph_spans(text)
-        ):
-            paragraph_text = text[para_start:para_end]
-            doc = self._nlp(paragraph_text)
+        paragraph_spans = _iter_paragraph_spans(text)
+        paragraphs = [text[start:end] for start, end in paragraph_spans]
+        docs = self._nlp.pipe(
+            paragraphs, batch_size=self._batch_size, n_process=self._n_process
+        )
 
+        for paragraph_index, ((para_start, _), paragraph_text, doc) in enumerate(
+            zip(paragraph_spans, paragraphs, docs, strict=True)
+        ):
             for sent in doc.sents:
                 if self._split_clauses:
                     clauses = _split_sentence(paragraph_text, sent)
@@ -109,61 +158,3 @@ class SpacyAnswerSegmenter:
                 sentence_index += 1
 
         return spans
-
-
-_PARA_BREAK_RE = re.compile(r"\n[ \t]*\n+")
-
-
-def _iter_paragraph_spans(text: str) -> list[tuple[int, int]]:
-    """Yields start and end character offsets for each non-empty paragraph.
-
-    Paragraphs are defined as text blocks separated by two or more newlines.
-
-    Args:
-        text (str): The text to split into paragraphs.
-
-    Returns:
-        list[tuple[int, int]]: A list of (start, end) character offsets covering
-            non-empty, trimmed paragraphs.
-    """
-    spans: list[tuple[int, int]] = []
-    start = 0
-
-    for match in _PARA_BREAK_RE.finditer(text):
-        end = match.start()
-        paragraph = _trim_span(text, start, end)
-        if paragraph is not None:
-            spans.append(paragraph)
-        start = match.end()
-
-    paragraph = _trim_span(text, start, len(text))
-    if paragraph is not None:
-        spans.append(paragraph)
-
-    return spans
-
-
-def _trim_span(text: str, start: int, end: int) -> tuple[int, int] | None:
-    """Returns trimmed (start, end) span or None if the range is empty/whitespace.
-
-    Args:
-        text (str): The parent text.
-        start (int): Start offset.
-        end (int): End offset.
-
-    Returns:
-        tuple[int, int] | None: Trimmed span as (start, end), or None if the
-            specified range is whitespace or invalid.
-    """
-    if start >= end:
-        return None
-    snippet = text[start:end]
-    if not snippet.strip():
-        return None
-    left_trim = len(snippet) - len(snippet.lstrip())
-    right_trim = len(snippet) - len(snippet.rstrip())
-    trimmed_start = start + left_trim
-    trimmed_end = end - right_trim
-    if trimmed_start >= trimmed_end:
-        return None
-    return trimmed_start, trimmed_end
@@ -47,7 +47,32 @@ def generate_passages(
         list[Passage]: A list of Passage objects, each containing `window_size_sentences` consecutive segments,
             sliding by `window_stride_sentences`.
     """
-    segments = segmenter.segment(text)
+    return passages_from_segments(
+        text,
+        segmenter.segment(text),
+        window_size_sentences=window_size_sentences,
+        window_stride_sentences=window_stride_sentences,
+    )
+
+
+def passages_from_segments(
+    text: str,
+    segments: list[Segment],
+    *,
+    window_size_sentences: int = 1,
+    window_stride_sentences: int = 1,
+) -> list[Passage]:
+    """Group already-computed segments of `text` into sliding-window passages.
+
+    Args:
+        text (str): The text the segments were taken from.
+        segments (list[Segment]): The segments of `text`, in document order.
+        window_size_sentences (int, optional): The number of segments per passage window. Defaults to 1.
+        window_stride_sentences (int, optional): The stride for the sliding window, in segments. Defaults to 1.
+
+    Returns:
+        list[Passage]: The same passages `generate_passages` returns for these segments.
+    """
     if not segments:
         return []
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from cite_right.core.results import Segment
+from cite_right.text.segmenter_simple import _add_segment
 
 
 class PySBDSegmenter:
@@ -64,27 +65,7 @@ class PySBDSegmenter:
                 sentence = stripped
 
             end = start + len(sentence)
-
-            snippet = text[start:end]
-            stripped = snippet.strip()
-            if not stripped:
-                cursor = end
-                continue
-
-            left_trim = len(snippet) - len(snippet.lstrip())
-            right_trim = len(snippet) - len(snippet.rstrip())
-            seg_start = start + left_trim
-            seg_end = end - right_trim
-
-            if seg_start < seg_end:
-                segments.append(
-                    Segment(
-                        text=text[seg_start:seg_end],
-                        doc_char_start=seg_start,
-                        doc_char_end=seg_end,
-                    )
-                )
-
+            _add_segment(text, start, end, segments)
             cursor = end
 
         return segments
@@ -2,8 +2,15 @@
 
 from __future__ import annotations
 
+import re
+
 from cite_right.core.results import Segment
 
+# Sentence punctuation counts as a boundary only before whitespace or at the
+# end of the text; `\s` matches exactly the characters `str.isspace` accepts.
+_BOUNDARY_RE = re.compile(r"[.?!](?=\s|\Z)|;")
+_BOUNDARY_WITH_NEWLINES_RE = re.compile(r"[.?!](?=\s|\Z)|;|\n")
+
 
 class SimpleSegmenter:
     """Simple rule-based sentence segmenter.
@@ -36,53 +43,19 @@ class SimpleSegmenter:
             list[Segment]: A list of Segment objects, each containing a text span and its
                 start and end character positions in the original text.
         """
+        boundary_re = (
+            _BOUNDARY_WITH_NEWLINES_RE if self.split_on_newlines else _BOUNDARY_RE
+        )
         segments: list[Segment] = []
         start = 0
-        idx = 0
-        length = len(text)
-
-        while idx < length:
-            char = text[idx]
-            if char == "\n" and self.split_on_newlines:
-                _add_segment(text, start, idx, segments)
-                start = idx + 1
-                idx += 1
-                continue
-
-            if char in ".?!" and _is_boundary(text, idx):
-                end = idx + 1
-                while end < length and text[end] in ".?!":
-                    end += 1
-                _add_segment(text, start, end, segments)
-                start = end
-                idx = end
-                continue
-
-            if char == ";":
-                _add_segment(text, start, idx + 1, segments)
-                start = idx + 1
-                idx += 1
-                continue
-
-            idx += 1
-
-        _add_segment(text, start, length, segments)
-        return segments
-
-
-def _is_boundary(text: str, idx: int) -> bool:
-    """Determines if the character at the given index is at a sentence boundary.
+        for match in boundary_re.finditer(text):
+            # Newlines are dropped from segments; punctuation is kept.
+            cut = match.start() if match.group() == "\n" else match.end()
+            _add_segment(text, start, cut, segments)
+            start = match.end()
 
-    Args:
-        text (str): The input text.
-        idx (int): The index of the punctuation character.
-
-    Returns:
-        bool: True if the punctuation is at the end of the text or is followed by whitespace.
-    """
-    if idx + 1 >= len(text):
-        return True
-    return text[idx + 1].isspace()
+        _add_segment(text, start, len(text), segments)
+        return segments
 
 
 def _add_segment(text: str, start: int, end: int, segments: list[Segment]) -> None:
@@ -97,20 +70,37 @@ def _add_segment(text: str, start: int, end: int, segments: list[Segment]) -> No
         end (int): The end character index of the candidate segment.
         segments (list[Segment]): The list to which a new Segment will be appended.
     """
-    if start >= end:
-        return
-    snippet = text[start:end]
-    stripped = snippet.strip()
-    if not stripped:
-        return
-    left_trim = len(snippet) - len(snippet.lstrip())
-    right_trim = len(snippet) - len(snippet.rstrip())
-    seg_start = start + left_trim
-    seg_end = end - right_trim
-    if seg_start >= seg_end:
+    trimmed = _trim_span(text, start, end)
+    if trimmed is None:
         return
+    seg_start, seg_end = trimmed
     segments.append(
         Segment(
             text=text[seg_start:seg_end], doc_char_start=seg_start, doc_char_end=seg_end
         )
     )
+
+
+def _trim_span(text: str, start: int, end: int) -> tuple[int, int] | None:
+    """Trims leading/trailing whitespace from a substring range.
+
+    Args:
+        text (str): The full text.
+        start (int): Start character index (inclusive).
+        end (int): End character index (exclusive).
+
+    Returns:
+        tuple[int, int] | None: Returns (trimmed_start, trimmed_end) if the
+            span is non-empty after trimming, otherwise None.
+    """
+    if start >= end:
+        return None
+    # Walk over the whitespace only, so the range is neither copied nor
+    # scanned in full.
+    while start < end and text[start].isspace():
+        start += 1
+    if start == end:
+        return None
+    while text[end - 1].isspace():
+        end -= 1
+    return start, end
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 import unicodedata
 from functools import lru_cache
 
@@ -70,6 +71,8 @@ class SimpleTokenizer:
         _config (TokenizerConfig): Tokenization and normalization configuration.
         _vocab (dict[str, int]): Mapping from normalized token to token id.
         _next_id (int): Next available token id.
+        _ids_by_raw (dict[str, int]): Mapping from raw token text to token id,
+            0 for tokens that normalize to nothing.
     """
 
     def __init__(self, config: TokenizerConfig | None = None) -> None:
@@ -82,6 +85,7 @@ class SimpleTokenizer:
         self._config = config or TokenizerConfig()
         self._vocab: dict[str, int] = {}
         self._next_id = 1
+        self._ids_by_raw: dict[str, int] = {}
 
     def tokenize(self, text: str) -> TokenizedText:
         """Tokenizes the input text into normalized token ids and spans.
@@ -95,22 +99,42 @@ class SimpleTokenizer:
         """
         token_ids: list[int] = []
         token_spans: list[tuple[int, int]] = []
+        ids_by_raw = self._ids_by_raw
 
-        for start, end in _iter_token_spans(text):
-            raw = text[start:end]
-            normalized = _normalize_token_cached(raw, self._config)
-            if not normalized:
-                continue
-            token_id = self._vocab.get(normalized)
+        for span in _iter_token_spans(text):
+            raw = text[span[0] : span[1]]
+            token_id = ids_by_raw.get(raw)
             if token_id is None:
-                token_id = self._next_id
-                self._vocab[normalized] = token_id
-                self._next_id += 1
-            token_ids.append(token_id)
-            token_spans.append((start, end))
+                token_id = ids_by_raw[raw] = self._token_id(raw)
+            if token_id:
+                token_ids.append(token_id)
+                token_spans.append(span)
 
         return TokenizedText(text=text, token_ids=token_ids, token_spans=token_spans)
 
+    def _token_id(self, raw: str) -> int:
+        """Normalizes a raw token and returns its id, assigning a new one if needed.
+
+        Args:
+            raw (str): The token text as it appears in the input.
+
+        Returns:
+            int: The token id, or 0 if the token normalizes to an empty string.
+        """
+        if raw.isascii() and raw.islower():
+            # NFKC and casefolding leave lowercase ASCII words unchanged.
+            normalized = raw
+        else:
+            normalized = _normalize_token_cached(raw, self._config)
+        if not normalized:
+            return 0
+        token_id = self._vocab.get(normalized)
+        if token_id is None:
+            token_id = self._next_id
+            self._vocab[normalized] = token_id
+            self._next_id += 1
+        return token_id
+
 
 def _iter_token_spans(text: str) -> list[tuple[int, int]]:
     """Yield the (start, end) spans of each token in the input string.
@@ -124,99 +148,50 @@ def _iter_token_spans(text: str) -> list[tuple[int, int]]:
     Returns:
         list[tuple[int, int]]: List of (start, end) indices for each token found in the input text.
     """
-    spans: list[tuple[int, int]] = []
-    idx = 0
-
-    while idx < len(text):
-        char = text[idx]
-        if char.isdigit():
-            end = _consume_number(text, idx)
-            spans.append((idx, end))
-            idx = end
-        elif char in {"%", "$", "€", "£"}:
-            spans.append((idx, idx + 1))
-            idx += 1
-        elif char.isalnum():
-            end = _consume_word(text, idx)
-            spans.append((idx, end))
-            idx = end
-        else:
-            idx += 1
-
-    return spans
+    pattern = _token_pattern(_non_decimal_digits(text))
+    return [match.span() for match in pattern.finditer(text)]
 
 
-def _consume_number(text: str, start: int) -> int:
-    """Consume a number token, including decimal separators and commas.
+@lru_cache(maxsize=64)
+def _token_pattern(extra_digits: str) -> re.Pattern[str]:
+    """Compile the token pattern, treating `extra_digits` as digits too.
 
-    Args:
-        text (str): The input text.
-        start (int): Starting index of the number token.
-
-    Returns:
-        int: Index immediately after the last character of the number token.
-    """
-    idx = start + 1
-    while idx < len(text):
-        char = text[idx]
-        if char.isdigit():
-            idx += 1
-        elif (
-            char in {".", ","}
-            and idx + 1 < len(text)
-            and text[idx - 1].isdigit()
-            and text[idx + 1].isdigit()
-        ):
-            idx += 1
-        else:
-            break
-    return idx
-
-
-def _consume_word(text: str, start: int) -> int:
-    """Consume an alphanumeric word token, supporting internal apostrophes and hyphens.
+    A number is a run of digits with single "." or "," separators between
+    digits. A word starts with any other alphanumeric character and may
+    contain an apostrophe or hyphen between alphanumerics. `[^\\W_]` matches
+    exactly the characters `str.isalnum` accepts; `\\d` matches those
+    `str.isdecimal` accepts, so digits that are not decimal (such as "²")
+    are passed in `extra_digits` to match `str.isdigit`.
 
     Args:
-        text (str): The input text.
-        start (int): Index at which the word token starts.
+        extra_digits (str): Characters that are digits but not decimals.
 
     Returns:
-        int: Index immediately after the last character of the word token.
+        re.Pattern[str]: The compiled token pattern.
     """
-    idx = start + 1
-    while idx < len(text):
-        char = text[idx]
-        if char.isalnum():
-            idx += 1
-        elif _is_internal_punctuation(text, idx, char):
-            idx += 1
-        else:
-            break
-    return idx
-
+    digit = f"[\\d{re.escape(extra_digits)}]" if extra_digits else r"\d"
+    return re.compile(
+        rf"{digit}+(?:[.,]{digit}+)*|[%$€£]|[^\W_]+(?:['\u2019-][^\W_]+)*"
+    )
 
-def _is_internal_punctuation(text: str, idx: int, char: str) -> bool:
-    """Check if the punctuation character is internal to a word (apostrophe or hyphen).
 
-    An internal punctuation is defined as a character that is both
-    preceded and followed by an alphanumeric character.
+def _non_decimal_digits(text: str) -> str:
+    """Return the characters of `text` that are digits but not decimals.
 
     Args:
         text (str): The input text.
-        idx (int): Index of the punctuation character in the text.
-        char (str): The punctuation character at `text[idx]`.
 
     Returns:
-        bool: True if the character at idx is internal punctuation, False otherwise.
+        str: The sorted, distinct characters; empty for ASCII text.
     """
-    if idx + 1 >= len(text):
-        return False
-    if not text[idx - 1].isalnum() or not text[idx + 1].isalnum():
-        return False
-    return char in {"'", "\u2019", "-"}
+    if text.isascii():
+        return ""
+    return "".join(
+        sorted(char for char in set(text) if char.isdigit() and not char.isdecimal())
+    )
 
 
-@lru_cache(maxsize=10000)
+@lru_cache(maxsize=1 << 16)
 def _normalize_token_cached(token: str, config: TokenizerConfig) -> str:
     """Normalize a token using the passed configuration, with LRU caching.
 
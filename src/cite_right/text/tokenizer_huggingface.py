@@ -14,7 +14,9 @@ Examples:
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from itertools import compress, starmap
+from operator import ne
+from typing import TYPE_CHECKING, Sequence
 
 from cite_right.core.results import TokenizedText
 
@@ -34,6 +36,7 @@ class HuggingFaceTokenizer:
         _tokenizer: Underlying HuggingFace tokenizer instance.
         _add_special_tokens: Whether or not to add special tokens.
         _is_transformers: Whether the tokenizer is a transformers tokenizer.
+        _special_ids: Special token IDs of the tokenizer, read once at init.
 
     Example:
         >>> from transformers import AutoTokenizer
@@ -63,6 +66,9 @@ class HuggingFaceTokenizer:
         self._tokenizer = tokenizer
         self._add_special_tokens = add_special_tokens
         self._is_transformers = self._check_tokenizer_type(tokenizer)
+        self._special_ids: frozenset[int] = frozenset(
+            getattr(tokenizer, "all_special_ids", ())
+        )
 
     @staticmethod
     def _check_tokenizer_type(tokenizer: object) -> bool:
@@ -158,60 +164,106 @@ class HuggingFaceTokenizer:
             return TokenizedText(text=text, token_ids=[], token_spans=[])
 
         if self._is_transformers:
-            return self._tokenize_transformers(text)
-        return self._tokenize_tokenizers(text)
+            return self._tokenize_transformers([text])[0]
+        return self._tokenize_tokenizers([text])[0]
+
+    def batch_tokenize(self, texts: Sequence[str]) -> list[TokenizedText]:
+        """Tokenize several texts with one call into the HuggingFace tokenizer.
 
-    def _tokenize_transformers(self, text: str) -> TokenizedText:
-        """Tokenize text using a transformers tokenizer.
+        Fast tokenizers encode a batch in parallel in Rust (see the
+        `TOKENIZERS_PARALLELISM` environment variable), so this is faster than
+        calling `tokenize` per text when there are many texts.
 
         Args:
-            text (str): The text to tokenize.
+            texts (Sequence[str]): The texts to tokenize.
 
         Returns:
-            TokenizedText: Object containing filtered token IDs and their character spans.
+            list[TokenizedText]: One result per text, as `tokenize` would return it.
+        """
+        results = [
+            TokenizedText(text=text, token_ids=[], token_spans=[]) for text in texts
+        ]
+        indices = [index for index, text in enumerate(texts) if text]
+        if not indices:
+            return results
+
+        batch = [texts[index] for index in indices]
+        if self._is_transformers:
+            tokenized = self._tokenize_transformers(batch)
+        else:
+            tokenized = self._tokenize_tokenizers(batch)
+        for index, result in zip(indices, tokenized, strict=True):
+            results[index] = result
+        return results
+
+    def _tokenize_transformers(self, texts: list[str]) -> list[TokenizedText]:
+        """Tokenize non-empty texts using a transformers tokenizer.
+
+        Args:
+            texts (list[str]): The texts to tokenize.
+
+        Returns:
+            list[TokenizedText]: Filtered token IDs and their character spans,
+                one result per text.
 
         Notes:
             This method internally uses the tokenizer with 'return_offsets_mapping=True' to
             obtain character spans, and will filter special tokens with empty spans.
         """
         encoding = self._tokenizer(  # type: ignore[operator]
-            text,
+            texts,
             return_offsets_mapping=True,
             add_special_tokens=self._add_special_tokens,
             return_attention_mask=False,
             return_token_type_ids=False,
         )
+        ids_per_text: list[list[int]] = encoding["input_ids"]  # type: ignore[index]
+        offsets_per_text: list[list[tuple[int, int]]] = encoding["offset_mapping"]  # type: ignore[index]
+        return [
+            self._filter_transformers_tokens(text, token_ids, offset_mapping)
+            for text, token_ids, offset_mapping in zip(
+                texts, ids_per_text, offsets_per_text, strict=True
+            )
+        ]
+
+    def _filter_transformers_tokens(
+        self,
+        text: str,
+        token_ids: list[int],
+        offset_mapping: list[tuple[int, int]],
+    ) -> TokenizedText:
+        """Drop special tokens from one transformers encoding.
 
-        token_ids: list[int] = encoding["input_ids"]  # type: ignore[index]
-        offset_mapping: list[tuple[int, int]] = encoding["offset_mapping"]  # type: ignore[index]
+        Args:
+            text (str): The tokenized text.
+            token_ids (list[int]): Token IDs of `text`.
+            offset_mapping (list[tuple[int, int]]): Character span of each token.
 
-        # Filter out special tokens (they have (0, 0) offsets)
-        token_spans: list[tuple[int, int]] = []
-        filtered_ids: list[int] = []
-
-        for token_id, (start, end) in zip(token_ids, offset_mapping, strict=True):
-            # Skip tokens with no character span (special tokens)
-            if start == end == 0 and self._add_special_tokens:
-                # Keep special tokens if explicitly requested
-                if token_id in self._get_special_token_ids():
-                    continue
-            token_spans.append((start, end))
-            filtered_ids.append(token_id)
+        Returns:
+            TokenizedText: Object containing filtered token IDs and their character spans.
+        """
+        if not self._add_special_tokens:
+            return TokenizedText(
+                text=text, token_ids=list(token_ids), token_spans=list(offset_mapping)
+            )
 
-        return TokenizedText(
-            text=text,
-            token_ids=filtered_ids,
-            token_spans=token_spans,
-        )
+        # Filter out special tokens (they have (0, 0) offsets)
+        special_ids = self._special_ids
+        keep = [
+            start != 0 or end != 0 or token_id not in special_ids
+            for token_id, (start, end) in zip(token_ids, offset_mapping, strict=True)
+        ]
+        return _compress_tokens(text, token_ids, offset_mapping, keep)
 
-    def _tokenize_tokenizers(self, text: str) -> TokenizedText:
-        """Tokenize text using a tokenizers library tokenizer.
+    def _tokenize_tokenizers(self, texts: list[str]) -> list[TokenizedText]:
+        """Tokenize non-empty texts using a tokenizers library tokenizer.
 
         Args:
-            text (str): The text to tokenize.
+            texts (list[str]): The texts to tokenize.
 
         Returns:
-            TokenizedText: Object containing filtered token IDs and their character spans.
+            list[TokenizedText]: Filtered token IDs and their character spans,
+                one result per text.
 
         Notes:
             Filters out any tokens with empty (start == end) spans.
@@ -220,32 +272,54 @@ class HuggingFaceTokenizer:
 
         tokenizer: HFTok = self._tokenizer  # type: ignore[assignment]
 
-        encoding = tokenizer.encode(text, add_special_tokens=self._add_special_tokens)
+        encodings = tokenizer.encode_batch(
+            texts, add_special_tokens=self._add_special_tokens
+        )
+        return [
+            _filter_empty_tokens(text, encoding.ids, encoding.offsets)
+            for text, encoding in zip(texts, encodings, strict=True)
+        ]
 
-        token_ids: list[int] = encoding.ids
-        offsets: list[tuple[int, int]] = encoding.offsets
 
-        token_spans: list[tuple[int, int]] = []
-        filtered_ids: list[int] = []
+def _filter_empty_tokens(
+    text: str, token_ids: list[int], offsets: list[tuple[int, int]]
+) -> TokenizedText:
+    """Drop tokens with empty (start == end) spans from one tokenizers encoding.
 
-        for token_id, (start, end) in zip(token_ids, offsets, strict=True):
-            if start != end:
-                token_spans.append((start, end))
-                filtered_ids.append(token_id)
+    Args:
+        text (str): The tokenized text.
+        token_ids (list[int]): Token IDs of `text`.
+        offsets (list[tuple[int, int]]): Character span of each token.
 
-        return TokenizedText(
-            text=text,
-            token_ids=filtered_ids,
-            token_spans=token_spans,
-        )
+    Returns:
+        TokenizedText: Object containing filtered token IDs and their character spans.
+    """
+    return _compress_tokens(text, token_ids, offsets, list(starmap(ne, offsets)))
 
-    def _get_special_token_ids(self) -> set[int]:
-        """Get the set of special token IDs from the tokenizer.
 
-        Returns:
-            set[int]: Set of special token IDs. Returns empty set if not available.
-        """
-        special_ids: set[int] = set()
-        if hasattr(self._tokenizer, "all_special_ids"):
-            special_ids = set(self._tokenizer.all_special_ids)  # type: ignore[union-attr]
-        return special_ids
+def _compress_tokens(
+    text: str,
+    token_ids: list[int],
+    token_spans: list[tuple[int, int]],
+    keep: list[bool],
+) -> TokenizedText:
+    """Keep the tokens whose `keep` flag is set, without a per-token Python loop.
+
+    Args:
+        text (str): The tokenized text.
+        token_ids (list[int]): Token IDs of `text`.
+        token_spans (list[tuple[int, int]]): Character span of each token.
+        keep (list[bool]): Whether to keep each token.
+
+    Returns:
+        TokenizedText: Object containing the kept token IDs and their character spans.
+    """
+    if all(keep):
+        return TokenizedText(
+            text=text, token_ids=list(token_ids), token_spans=list(token_spans)
+        )
+    return TokenizedText(
+        text=text,
+        token_ids=list(compress(token_ids, keep)),
+        token_spans=list(compress(token_spans, keep)),
+    )
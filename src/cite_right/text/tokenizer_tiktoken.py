@@ -14,7 +14,10 @@ Example:
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Sequence
+
+import numpy as np
+import numpy.typing as npt
 
 from cite_right.core.results import TokenizedText
 
@@ -31,6 +34,9 @@ class TiktokenTokenizer:
 
     Attributes:
         _encoding: The tiktoken Encoding instance used for tokenization.
+        _byte_lengths: UTF-8 byte length of each token id, or -1 for ids
+            not seen yet.
+        _num_threads: Thread count passed to `encode_batch`.
 
     Examples:
         >>> tokenizer = TiktokenTokenizer("cl100k_base")
@@ -44,6 +50,7 @@ class TiktokenTokenizer:
         encoding_name: str = "cl100k_base",
         *,
         encoding: tiktoken.Encoding | None = None,
+        num_threads: int = 8,
     ) -> None:
         """Initializes the TiktokenTokenizer.
 
@@ -56,11 +63,22 @@ class TiktokenTokenizer:
                 Defaults to "cl100k_base".
             encoding (tiktoken.Encoding, optional):
                 A pre-initialized tiktoken Encoding object. If provided,
-                `encoding_name` is ignored.
+                `encoding_name` is ignored. Any object with the same `encode`,
+                `encode_batch`, `decode_tokens_bytes`, `n_vocab` and `name`
+                members works, so byte-identical reimplementations of tiktoken
+                can be passed here.
+            num_threads (int, optional): Threads tiktoken's `encode_batch` spreads
+                a batch over in `batch_tokenize`. Encoding runs in Rust without the
+                GIL, so raise this on hosts with many cores. Defaults to 8,
+                tiktoken's own default.
 
         Raises:
             ImportError: If tiktoken is not installed.
+            ValueError: If `num_threads` is less than 1.
         """
+        if num_threads < 1:
+            raise ValueError("num_threads must be >= 1")
+
         try:
             import tiktoken as _tiktoken
         except ImportError as e:
@@ -73,6 +91,8 @@ class TiktokenTokenizer:
             self._encoding = encoding
         else:
             self._encoding = _tiktoken.get_encoding(encoding_name)
+        self._byte_lengths = np.full(self._encoding.n_vocab, -1, dtype=np.int64)
+        self._num_threads = num_threads
 
     def tokenize(self, text: str) -> TokenizedText:
         """Tokenizes input text with tiktoken BPE, mapping byte spans to character spans.
@@ -94,60 +114,68 @@ class TiktokenTokenizer:
         """
         if not text:
             return TokenizedText(text=text, token_ids=[], token_spans=[])
+        return self._tokenized(text, self._encoding.encode(text, allowed_special="all"))
 
-        token_ids = self._encoding.encode(text, allowed_special="all")
-
-        if not token_ids:
-            return TokenizedText(text=text, token_ids=[], token_spans=[])
-
-        text_bytes = text.encode("utf-8")
-
-        byte_to_char: list[int] = []
-        char_idx = 0
-        byte_idx = 0
-
-        while byte_idx < len(text_bytes):
-            byte_to_char.append(char_idx)
-            byte_val = text_bytes[byte_idx]
-            if byte_val < 0x80:  # 1-byte character (ASCII)
-                char_len_bytes = 1
-            elif byte_val < 0xE0:  # 2-byte character
-                char_len_bytes = 2
-            elif byte_val < 0xF0:  # 3-byte character
-                char_len_bytes = 3
-            else:  # 4-byte character
-                char_len_bytes = 4
-
-            for _ in range(1, char_len_bytes):
-                byte_idx += 1
-                if byte_idx < len(text_bytes):
-                    byte_to_char.append(char_idx)
-
-            byte_idx += 1
-            char_idx += 1
+    def batch_tokenize(self, texts: Sequence[str]) -> list[TokenizedText]:
+        """Tokenizes several texts with one `encode_batch` call.
 
-        byte_to_char.append(char_idx)
+        tiktoken encodes the batch on its own thread pool of `num_threads`
+        workers, so this is faster than calling `tokenize` per text when there
+        are many texts.
 
-        token_spans: list[tuple[int, int]] = []
-        byte_offset = 0
+        Args:
+            texts (Sequence[str]): The texts to tokenize.
 
-        for token_id in token_ids:
-            token_bytes = self._encoding.decode_single_token_bytes(token_id)
-            byte_start = byte_offset
-            byte_end = byte_offset + len(token_bytes)
+        Returns:
+            list[TokenizedText]: One result per text, as `tokenize` would return it.
+        """
+        token_ids_per_text = self._encoding.encode_batch(
+            list(texts), num_threads=self._num_threads, allowed_special="all"
+        )
+        return [
+            self._tokenized(text, token_ids)
+            for text, token_ids in zip(texts, token_ids_per_text, strict=True)
+        ]
 
-            char_start = byte_to_char[byte_start]
-            char_end = byte_to_char[byte_end]
+    def _tokenized(self, text: str, token_ids: list[int]) -> TokenizedText:
+        """Builds the TokenizedText for `text` from its token ids.
 
-            token_spans.append((char_start, char_end))
-            byte_offset = byte_end
+        Args:
+            text (str): The tokenized text.
+            token_ids (list[int]): The ids tiktoken produced for `text`.
 
+        Returns:
+            TokenizedText: The token ids with their character spans.
+        """
+        if not token_ids:
+            return TokenizedText(text=text, token_ids=[], token_spans=[])
         return TokenizedText(
             text=text,
             token_ids=list(token_ids),
-            token_spans=token_spans,
+            token_spans=_char_spans(text, self._token_byte_lengths(token_ids)),
         )
 
+    def _token_byte_lengths(self, token_ids: list[int]) -> npt.NDArray[np.int64]:
+        """Returns the UTF-8 byte length of each token.
+
+        Lengths are looked up in a per-vocabulary table. Only ids not seen
+        before are decoded, once each.
+
+        Args:
+            token_ids (list[int]): The token ids to measure.
+
+        Returns:
+            npt.NDArray[np.int64]: The byte length of each token, in order.
+        """
+        ids = np.asarray(token_ids, dtype=np.int64)
+        lengths = self._byte_lengths[ids]
+        unseen = np.unique(ids[lengths < 0]).tolist()
+        if unseen:
+            decoded = self._encoding.decode_tokens_bytes(unseen)
+            self._byte_lengths[unseen] = [len(token) for token in decoded]
+            lengths = self._byte_lengths[ids]
+        return lengths
+
     @property
     def encoding_name(self) -> str:
         """Returns the name of the tiktoken encoding.
@@ -156,3 +184,43 @@ class TiktokenTokenizer:
             str: The name of the encoding being used.
         """
         return self._encoding.name
+
+    @property
+    def backend(self) -> str:
+        """Returns the top-level package providing the encoding.
+
+        Returns:
+            str: "tiktoken" by default, or the package of a custom `encoding`.
+        """
+        return type(self._encoding).__module__.partition(".")[0]
+
+
+def _char_spans(
+    text: str, token_byte_lengths: npt.NDArray[np.int64]
+) -> list[tuple[int, int]]:
+    """Map consecutive UTF-8 byte spans of `text` to character spans.
+
+    Every byte is mapped to the character it belongs to, so a token that
+    starts or ends inside a multi-byte character is widened or narrowed to
+    that character's start. For ASCII text bytes and characters coincide,
+    so the byte spans are returned as they are.
+
+    Args:
+        text (str): The tokenized text.
+        token_byte_lengths (npt.NDArray[np.int64]): Byte length of each token, in order;
+            together they cover the UTF-8 encoding of `text`.
+
+    Returns:
+        list[tuple[int, int]]: The (char_start, char_end) span of each token.
+    """
+    byte_ends = np.cumsum(token_byte_lengths)
+    byte_starts = byte_ends - token_byte_lengths
+    if not text.isascii():
+        byte_values = np.frombuffer(text.encode("utf-8"), dtype=np.uint8)
+        # Continuation bytes (0b10xxxxxx) belong to the character of the lead
+        # byte before them; the final entry maps the end of the text.
+        is_lead_byte = (byte_values & 0xC0) != 0x80
+        byte_to_char = np.append(np.cumsum(is_lead_byte) - 1, len(text))
+        byte_starts = byte_to_char[byte_starts]
+        byte_ends = byte_to_char[byte_ends]
+    return list(zip(byte_starts.tolist(), byte_ends.tolist(), strict=True))
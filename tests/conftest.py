@@ -28,6 +28,7 @@ def pytest_configure(config: pytest.Config) -> None:
     config.addinivalue_line("markers", "tiktoken: requires tiktoken")
     config.addinivalue_line("markers", "huggingface: requires transformers/tokenizers")
     config.addinivalue_line("markers", "pysbd: requires pysbd")
+    config.addinivalue_line("markers", "parasail: requires parasail")
     config.addinivalue_line("markers", "slow: marks tests as slow")
 
 
@@ -204,6 +205,22 @@ requires_pysbd = pytest.mark.skipif(
 )
 
 
+# =============================================================================
+# Parasail Fixtures
+# =============================================================================
+
+
+def _parasail_available() -> bool:
+    """Check if parasail is available."""
+    return importlib.util.find_spec("parasail") is not None
+
+
+requires_parasail = pytest.mark.skipif(
+    not _parasail_available(),
+    reason="parasail is not installed",
+)
+
+
 # =============================================================================
 # Citation Config Fixtures
 # =============================================================================
@@ -1,6 +1,89 @@
 """Tests for Python Smith-Waterman aligner implementation."""
 
+import random
+
+import numpy as np
+import pytest
+
+from cite_right.core import aligner_numba
 from cite_right.core.aligner_py import SmithWatermanAligner
+from cite_right.core.results import Alignment
+
+from .conftest import requires_parasail
+
+
+def _reference_align(
+    seq1: list[int],
+    seq2: list[int],
+    match_score: int,
+    mismatch_score: int,
+    gap_score: int,
+) -> Alignment:
+    """Scalar Smith-Waterman with the original row loop and tie-breaking.
+
+    Every maximum cell is traced back, and the alignment with the earliest
+    target start, then the longest target span, then the earliest query
+    start wins. The optimized aligner must reproduce this exactly.
+    """
+    if not seq1 or not seq2:
+        return Alignment(score=0, token_start=0, token_end=0)
+    rows, cols = len(seq1) + 1, len(seq2) + 1
+    scores = [[0] * cols for _ in range(rows)]
+    directions = [[0] * cols for _ in range(rows)]  # 0 stop, 1 diag, 2 up, 3 left
+    max_score = 0
+    max_positions: list[tuple[int, int]] = []
+    for i in range(1, rows):
+        for j in range(1, cols):
+            sub = match_score if seq1[i - 1] == seq2[j - 1] else mismatch_score
+            diag = scores[i - 1][j - 1] + sub
+            up = scores[i - 1][j] + gap_score
+            left = scores[i][j - 1] + gap_score
+            best = max(0, diag, up, left)
+            if best <= 0:
+                continue
+            scores[i][j] = best
+            directions[i][j] = 1 if best == diag else 2 if best == up else 3
+            if best > max_score:
+                max_score, max_positions = best, [(i, j)]
+            elif best == max_score:
+                max_positions.append((i, j))
+    if max_score == 0:
+        return Alignment(score=0, token_start=0, token_end=0)
+
+    best_key = None
+    best_alignment = None
+    for i_end, j_end in max_positions:
+        i, j, matched = i_end, j_end, []
+        while i > 0 and j > 0 and directions[i][j] and scores[i][j] > 0:
+            step = directions[i][j]
+            if step == 1:
+                i, j = i - 1, j - 1
+                if seq1[i] == seq2[j]:
+                    matched.append(j)
+            elif step == 2:
+                i -= 1
+            else:
+                j -= 1
+        key = (j, -(j_end - j), i, j_end, i_end)
+        if best_key is None or key < best_key:
+            blocks: list[tuple[int, int]] = []
+            for pos in reversed(matched):
+                if blocks and blocks[-1][1] == pos:
+                    blocks[-1] = (blocks[-1][0], pos + 1)
+                else:
+                    blocks.append((pos, pos + 1))
+            best_key = key
+            best_alignment = Alignment(
+                score=max_score,
+                token_start=j,
+                token_end=j_end,
+                query_start=i,
+                query_end=i_end,
+                matches=len(matched),
+                match_blocks=blocks,
+            )
+    assert best_alignment is not None
+    return best_alignment
 
 
 def test_alignment_basic() -> None:
@@ -84,3 +167,176 @@ def test_alignment_single_element_match() -> None:
     assert result.score == 2, f"Expected score 2, got {result.score}"
     assert result.token_start == 2
     assert result.token_end == 3
+
+
+def test_alignment_disjoint_tokens_with_positive_mismatch_still_scores() -> None:
+    """Verify the disjoint-token shortcut does not apply when mismatches score."""
+    aligner = SmithWatermanAligner(mismatch_score=1)
+    result = aligner.align([1], [2])
+
+    assert result.score == 1, f"Expected score 1, got {result.score}"
+    assert result.token_start == 0
+    assert result.token_end == 1
+    assert result.matches == 0
+
+
+@requires_parasail
+def test_alignment_parasail_matches_numpy() -> None:
+    """Verify the parasail-backed score matrix yields identical alignments."""
+    rng = random.Random(0)
+    accelerated = SmithWatermanAligner(return_match_blocks=True)
+    reference = SmithWatermanAligner(return_match_blocks=True)
+    reference._parasail = None
+
+    assert accelerated._parasail is not None
+    for _ in range(200):
+        seq1 = [rng.randint(0, 8) for _ in range(rng.randint(1, 20))]
+        seq2 = [rng.randint(0, 8) for _ in range(rng.randint(1, 40))]
+        assert accelerated.align(seq1, seq2) == reference.align(seq1, seq2)
+
+
+def test_alignment_compiled_kernels_match_numpy(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Verify the numba kernel path yields identical alignments.
+
+    Without numba installed the kernels run as plain Python, which still
+    exercises the same code path.
+    """
+    rng = random.Random(1)
+    reference = SmithWatermanAligner(return_match_blocks=True)
+    reference._parasail = None
+    compiled = SmithWatermanAligner(return_match_blocks=True)
+
+    pairs = [
+        (
+            [rng.randint(0, 8) for _ in range(rng.randint(1, 20))],
+            [rng.randint(0, 8) for _ in range(rng.randint(1, 40))],
+        )
+        for _ in range(100)
+    ]
+    expected = [reference.align(seq1, seq2) for seq1, seq2 in pairs]
+
+    monkeypatch.setattr(aligner_numba, "NUMBA_AVAILABLE", True)
+    assert [compiled.align(seq1, seq2) for seq1, seq2 in pairs] == expected
+
+
+def test_alignment_wide_band_matches_full(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify a band covering the whole matrix gives the exact alignment."""
+    rng = random.Random(2)
+    full = SmithWatermanAligner(return_match_blocks=True)
+    banded = SmithWatermanAligner(return_match_blocks=True, band_width=64)
+
+    pairs = [
+        (
+            [rng.randint(0, 8) for _ in range(rng.randint(1, 20))],
+            [rng.randint(0, 8) for _ in range(rng.randint(1, 40))],
+        )
+        for _ in range(100)
+    ]
+    expected = [full.align(seq1, seq2) for seq1, seq2 in pairs]
+    assert [banded.align(seq1, seq2) for seq1, seq2 in pairs] == expected
+
+    monkeypatch.setattr(aligner_numba, "NUMBA_AVAILABLE", True)
+    assert [banded.align(seq1, seq2) for seq1, seq2 in pairs] == expected
+
+
+def test_alignment_narrow_band_finds_diagonal_match() -> None:
+    """Verify a narrow band still finds a match near the scaled diagonal."""
+    seq1 = list(range(10))
+    seq2 = [100, 101, *range(10), 102, 103]
+    aligner = SmithWatermanAligner(band_width=2)
+
+    result = aligner.align(seq1, seq2)
+
+    assert result == SmithWatermanAligner().align(seq1, seq2)
+    assert (result.token_start, result.token_end) == (2, 12)
+
+
+def test_alignment_band_widens_when_alignment_reaches_edge() -> None:
+    """Verify the band grows until the alignment lies strictly inside it."""
+    seq1 = list(range(1, 9))
+    seq2 = [100, 101, 102, 103, *seq1]
+    aligner = SmithWatermanAligner(band_width=1)
+
+    result = aligner.align(seq1, seq2)
+
+    assert result.score == 16
+    assert (result.token_start, result.token_end) == (4, 12)
+
+
+def test_alignment_repetitive_tokens_prefer_earliest_start() -> None:
+    """Verify ties among many maximum cells resolve to the earliest span."""
+    aligner = SmithWatermanAligner(return_match_blocks=True)
+
+    result = aligner.align([7, 7, 7], [7] * 50)
+
+    assert result.score == 6
+    assert (result.token_start, result.token_end) == (0, 3)
+    assert (result.query_start, result.query_end) == (0, 3)
+    assert result.match_blocks == [(0, 3)]
+
+
+def test_alignment_reused_buffers_match_fresh_aligner() -> None:
+    """Verify results do not depend on earlier calls reusing the matrices."""
+    rng = random.Random(3)
+    shared = SmithWatermanAligner(return_match_blocks=True)
+
+    for _ in range(50):
+        seq1 = [rng.randint(0, 5) for _ in range(rng.randint(1, 30))]
+        seq2 = [rng.randint(0, 5) for _ in range(rng.randint(1, 60))]
+        fresh = SmithWatermanAligner(return_match_blocks=True)
+        assert shared.align(seq1, seq2) == fresh.align(seq1, seq2)
+
+
+def test_alignment_accepts_numpy_token_arrays() -> None:
+    """Verify NumPy token arrays align exactly like the equivalent lists."""
+    aligner = SmithWatermanAligner(return_match_blocks=True)
+    seq1 = [3, 4, 5, 9]
+    seq2 = [1, 3, 4, 5, 2, 9]
+
+    expected = aligner.align(seq1, seq2)
+
+    for dtype in (np.int64, np.int32):
+        result = aligner.align(np.array(seq1, dtype=dtype), np.array(seq2, dtype=dtype))
+        assert result == expected
+    assert aligner.align(np.array([], dtype=np.int64), seq2).score == 0
+
+
+@pytest.mark.parametrize(
+    ("match_score", "mismatch_score", "gap_score"),
+    [(2, -1, -1), (2, 0, 0), (3, 1, -1), (2, -1, 1), (1, -2, -3)],
+)
+@pytest.mark.parametrize("compiled", [False, True])
+def test_alignment_matches_scalar_reference(
+    monkeypatch: pytest.MonkeyPatch,
+    match_score: int,
+    mismatch_score: int,
+    gap_score: int,
+    compiled: bool,
+) -> None:
+    """Verify every backend against the original scalar row loop.
+
+    Small alphabets and single-token runs produce many tied maximum cells,
+    which exercises the start-floor cutoff in the tie-breaking.
+    """
+    rng = random.Random(f"{match_score},{mismatch_score},{gap_score}")
+    aligner = SmithWatermanAligner(
+        match_score, mismatch_score, gap_score, return_match_blocks=True
+    )
+    aligner._parasail = None
+    monkeypatch.setattr(aligner_numba, "NUMBA_AVAILABLE", compiled)
+
+    pairs = [([7] * 3, [7] * 20), ([1, 2] * 4, [1, 2] * 10), ([5], [6] * 4)]
+    for _ in range(150):
+        alphabet = rng.choice([2, 4, 9])
+        pairs.append(
+            (
+                [rng.randrange(alphabet) for _ in range(rng.randint(1, 15))],
+                [rng.randrange(alphabet) for _ in range(rng.randint(1, 30))],
+            )
+        )
+
+    for seq1, seq2 in pairs:
+        expected = _reference_align(seq1, seq2, match_score, mismatch_score, gap_score)
+        assert aligner.align(seq1, seq2) == expected, (seq1, seq2)
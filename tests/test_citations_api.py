@@ -2,8 +2,16 @@
 
 import pytest
 
-from cite_right import SourceChunk, SourceDocument, align_citations
+from cite_right import (
+    AlignmentMetrics,
+    SourceChunk,
+    SourceDocument,
+    align_citations,
+)
 from cite_right.core.citation_config import CitationConfig, CitationWeights
+from cite_right.core.results import Segment, TokenizedText
+from cite_right.text.segmenter_simple import SimpleSegmenter
+from cite_right.text.tokenizer import SimpleTokenizer
 
 from .conftest import requires_rust
 
@@ -248,3 +256,68 @@ def test_align_citations_python_and_rust_backends_match() -> None:
     python = align_citations(answer, sources, config=config, backend="python")
     rust = align_citations(answer, sources, config=config, backend="rust")
     assert rust == python
+
+
+class _BatchingSegmenter(SimpleSegmenter):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[list[str]] = []
+
+    def batch_segment(self, texts: list[str]) -> list[list[Segment]]:
+        self.batches.append(list(texts))
+        return [self.segment(text) for text in texts]
+
+
+def test_align_citations_segments_sources_in_one_batch() -> None:
+    """Verify sources go through `batch_segment` once when it is available."""
+    segmenter = _BatchingSegmenter()
+    sources = ["Filler text. Apple revenue is up.", "Stocks are down today."]
+
+    batched = align_citations(
+        "Apple revenue is up.", sources, source_segmenter=segmenter
+    )
+
+    assert segmenter.batches == [sources]
+    assert batched == align_citations("Apple revenue is up.", sources)
+
+
+class _BatchingTokenizer(SimpleTokenizer):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[list[str]] = []
+
+    def batch_tokenize(self, texts: list[str]) -> list[TokenizedText]:
+        self.batches.append(list(texts))
+        return [self.tokenize(text) for text in texts]
+
+
+def test_align_citations_tokenizes_passages_in_one_batch() -> None:
+    """Verify passages and answer spans go through `batch_tokenize` when available."""
+    tokenizer = _BatchingTokenizer()
+    sources = ["Filler text. Apple revenue is up.", "Stocks are down today."]
+
+    batched = align_citations("Apple revenue is up.", sources, tokenizer=tokenizer)
+
+    assert len(tokenizer.batches) == 2
+    assert "Stocks are down today." in tokenizer.batches[0]
+    assert tokenizer.batches[1] == ["Apple revenue is up."]
+    assert batched == align_citations("Apple revenue is up.", sources)
+
+
+def test_align_citations_early_exit_stops_after_strong_citation() -> None:
+    """Verify candidates after one clearing the early-exit coverage are skipped."""
+    answer = "Apple revenue is up."
+    sources = ["Apple revenue is up.", "Apple revenue is up strongly.", "Up."]
+    metrics: list[AlignmentMetrics] = []
+
+    full = align_citations(answer, sources)
+    early = align_citations(
+        answer,
+        sources,
+        config=CitationConfig(early_exit_answer_coverage=0.9),
+        on_metrics=metrics.append,
+    )
+
+    assert len(full[0].citations) > 1
+    assert early[0].citations == full[0].citations[:1]
+    assert metrics[0].num_alignments == 1
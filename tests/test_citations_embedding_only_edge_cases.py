@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Sequence
 
-from cite_right import SourceDocument, align_citations
+from cite_right import AlignmentMetrics, SourceDocument, align_citations
 from cite_right.core.citation_config import CitationConfig, CitationWeights
 from cite_right.models.base import Embedder
 
@@ -80,3 +80,48 @@ def test_align_citations_embedding_only_populates_evidence_spans() -> None:
     assert citation.evidence_spans[0].evidence == citation.evidence
     assert citation.evidence_spans[0].char_start == citation.char_start
     assert citation.evidence_spans[0].char_end == citation.char_end
+
+
+def test_align_citations_skips_alignment_for_disjoint_embedding_candidates() -> None:
+    sources = [SourceDocument(id="finance", text="Quarterly profits rose sharply.")]
+    answer = "Earnings went up."
+    metrics: list[AlignmentMetrics] = []
+
+    results = align_citations(
+        answer,
+        sources,
+        embedder=KeywordEmbedder(""),
+        config=CitationConfig(
+            top_k=1,
+            allow_embedding_only=True,
+            min_embedding_similarity=0.5,
+            supported_embedding_similarity=0.5,
+        ),
+        backend="python",
+        on_metrics=metrics.append,
+    )
+
+    assert results[0].citations
+    assert results[0].citations[0].components["embedding_only"] == 1.0
+    assert metrics[0].num_candidates == 1
+    assert metrics[0].num_alignments == 0
+
+
+class _RecordingEmbedder(KeywordEmbedder):
+    def __init__(self, keyword: str) -> None:
+        super().__init__(keyword)
+        self.calls: list[list[str]] = []
+
+    def encode(self, texts: Sequence[str]) -> list[list[float]]:
+        self.calls.append(list(texts))
+        return super().encode(texts)
+
+
+def test_align_citations_encodes_spans_and_passages_in_one_call() -> None:
+    embedder = _RecordingEmbedder("assertions")
+    answer = "LM Assertions help. LM Assertions help."
+    sources = ["LM Assertions help.", "Storms are likely."]
+
+    align_citations(answer, sources, embedder=embedder)
+
+    assert embedder.calls == [["LM Assertions help.", "Storms are likely."]]
@@ -97,3 +97,29 @@ def test_align_citations_embeddings_retrieves_candidate_with_lexical_disabled(
     assert len(results) == 1
     assert results[0].citations
     assert results[0].citations[0].source_id == "finance"
+
+
+def test_embedder_cache_returns_identical_vectors(
+    embedder: SentenceTransformerEmbedder,
+) -> None:
+    texts = ["Revenue grew quickly.", "Stocks fell.", "Revenue grew quickly."]
+
+    first = embedder.encode(texts)
+    second = embedder.encode(list(reversed(texts)))
+
+    assert first[0] == first[2]
+    assert second == list(reversed(first))
+    assert len(embedder._cache) >= 2
+
+
+def test_embedder_results_do_not_alias_the_cache(
+    embedder: SentenceTransformerEmbedder,
+) -> None:
+    texts = ["Margins widened.", "Margins widened."]
+
+    first = embedder.encode(texts)
+    expected = list(first[1])
+    first[0][0] += 1.0
+
+    assert first[1] == expected
+    assert embedder.encode(texts) == [expected, expected]
@@ -1,5 +1,7 @@
 """Tests for SpaCy-based segmentation in citation alignment."""
 
+import pytest
+
 from cite_right import SpacyAnswerSegmenter, SpacySegmenter, align_citations
 from cite_right.core.citation_config import CitationConfig, CitationWeights
 
@@ -67,3 +69,46 @@ def test_align_citations_spacy_does_not_split_lists() -> None:
     assert results[0].citations[0].evidence == answer[:-1], (
         "Evidence should exclude trailing punctuation"
     )
+
+
+@requires_spacy_model
+def test_spacy_segmenters_skip_unused_pipeline_components() -> None:
+    """Verify the default pipelines leave out components segmentation never reads."""
+    sentence_segmenter = SpacyAnswerSegmenter()
+    clause_segmenter = SpacyAnswerSegmenter(split_clauses=True)
+
+    assert "parser" in sentence_segmenter._nlp.pipe_names
+    assert "ner" not in sentence_segmenter._nlp.pipe_names
+    assert "tagger" not in sentence_segmenter._nlp.pipe_names
+    assert "tagger" in clause_segmenter._nlp.pipe_names
+    assert "ner" not in clause_segmenter._nlp.pipe_names
+    assert "ner" in SpacySegmenter(exclude=())._nlp.pipe_names
+
+
+@requires_spacy_model
+def test_spacy_answer_segmenter_keeps_paragraph_offsets() -> None:
+    """Verify batched paragraph parsing maps spans back to the full answer."""
+    answer = "Revenue grew. Costs fell.\n\nMargins improved.\n\n\nOutlook is stable."
+    spans = SpacyAnswerSegmenter().segment(answer)
+
+    assert [span.paragraph_index for span in spans] == [0, 0, 1, 2]
+    assert [span.sentence_index for span in spans] == [0, 1, 2, 3]
+    for span in spans:
+        assert answer[span.char_start : span.char_end] == span.text
+
+
+@requires_spacy_model
+def test_spacy_answer_segmenter_senter_skips_parser() -> None:
+    """Verify the senter mode segments sentences without loading the parser."""
+    segmenter = SpacyAnswerSegmenter(sentence_boundaries="senter")
+
+    assert "parser" not in segmenter._nlp.pipe_names
+    assert "senter" in segmenter._nlp.pipe_names
+    spans = segmenter.segment("Revenue grew. Costs fell.")
+    assert [span.text for span in spans] == ["Revenue grew.", "Costs fell."]
+
+
+def test_spacy_answer_segmenter_rejects_senter_with_clauses() -> None:
+    """Verify clause splitting cannot be combined with the senter."""
+    with pytest.raises(ValueError):
+        SpacyAnswerSegmenter(split_clauses=True, sentence_boundaries="senter")
@@ -0,0 +1,77 @@
+"""Tests for EmbeddingIndex similarity search."""
+
+import numpy as np
+
+from cite_right.models.embedding_index import EmbeddingIndex
+
+
+def test_embedding_index_top_k_orders_by_score_then_index() -> None:
+    index = EmbeddingIndex.from_vectors(
+        [[1.0, 0.0], [0.0, 1.0], [1.0, 0.0], [0.0, 0.0]]
+    )
+
+    hits = index.top_k([2.0, 0.0], 3)
+
+    assert [idx for idx, _ in hits] == [0, 2, 1]
+    assert hits[0][1] == 1.0
+
+
+def test_embedding_index_top_k_many_matches_single_queries() -> None:
+    index = EmbeddingIndex.from_vectors(
+        [[0.1, 0.9, 0.0], [0.7, 0.2, 0.1], [0.0, 0.0, 0.0], [0.3, 0.3, 0.3]]
+    )
+    queries = [[1.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.2, 0.5, 0.1]]
+
+    batched = index.top_k_many(queries, 2)
+
+    assert len(batched) == len(queries)
+    assert batched[1] == []
+    for query, hits in zip(queries, batched, strict=True):
+        single = index.top_k(query, 2)
+        assert [idx for idx, _ in hits] == [idx for idx, _ in single]
+        for (_, batched_score), (_, single_score) in zip(hits, single, strict=True):
+            assert abs(batched_score - single_score) < 1e-6
+
+
+def test_embedding_index_top_k_many_accepts_ndarray_queries() -> None:
+    index = EmbeddingIndex.from_vectors([[1.0, 0.0], [0.0, 1.0]])
+    queries = np.array([[1.0, 0.0], [0.0, 1.0]])
+
+    assert index.top_k_many(queries, 1) == [[(0, 1.0)], [(1, 1.0)]]
+    assert index.top_k_many(np.empty((0, 2)), 1) == []
+    # The caller's array is not normalized in place.
+    assert queries.tolist() == [[1.0, 0.0], [0.0, 1.0]]
+
+
+def test_embedding_index_top_k_breaks_ties_at_cutoff_by_index() -> None:
+    vectors = [[0.0, 1.0]] + [[1.0, 0.0]] * 6 + [[0.0, 0.0], [3.0, 0.0]]
+    index = EmbeddingIndex.from_vectors(vectors)
+
+    hits = index.top_k([1.0, 0.0], 4)
+
+    assert [idx for idx, _ in hits] == [1, 2, 3, 4]
+
+
+def test_embedding_index_arrays_are_read_only() -> None:
+    index = EmbeddingIndex.from_vectors([[3.0, 4.0], [0.0, 0.0]])
+
+    assert not index.vectors.flags.writeable
+    assert not index.norms.flags.writeable
+    assert index.norms.tolist() == [5.0, 0.0]
+
+
+def test_embedding_index_empty() -> None:
+    index = EmbeddingIndex.from_vectors([])
+
+    assert index.top_k([1.0, 0.0], 3) == []
+    assert index.top_k_many([[1.0], [0.0]], 3) == [[], []]
+
+
+def test_embedding_index_top_1_ties_and_zero_vectors() -> None:
+    index = EmbeddingIndex.from_vectors(
+        [[0.0, 0.0], [0.0, 1.0], [0.0, 2.0], [1.0, 1.0]]
+    )
+
+    assert index.top_k([0.0, 1.0], 1) == [(1, 1.0)]
+    # The best score belongs to the zero vector, which never matches.
+    assert index.top_k([-1.0, -1.0], 1) == []
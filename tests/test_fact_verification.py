@@ -9,11 +9,36 @@ from cite_right import (
     FactVerificationConfig,
     FactVerificationMetrics,
     SimpleClaimDecomposer,
+    SimpleTokenizer,
     SourceDocument,
+    align_citations,
+    citations,
+    clear_source_cache,
     verify_facts,
 )
 from cite_right.core.citation_config import CitationConfig, CitationWeights
-from cite_right.core.results import AnswerSpan
+from cite_right.core.results import AnswerSpan, Segment, TokenizedText
+from cite_right.text.segmenter_simple import SimpleSegmenter
+
+
+class _CountingSegmenter(SimpleSegmenter):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def segment(self, text: str) -> list[Segment]:
+        self.calls += 1
+        return super().segment(text)
+
+
+class _CountingTokenizer(SimpleTokenizer):
+    def __init__(self) -> None:
+        super().__init__()
+        self.texts: list[str] = []
+
+    def tokenize(self, text: str) -> TokenizedText:
+        self.texts.append(text)
+        return super().tokenize(text)
 
 
 class TestClaim:
@@ -253,6 +278,67 @@ class TestVerifyFactsSupported:
         assert len(metrics.verified_claims) == 1
         assert len(metrics.unverified_claims) == 0
 
+    def test_sources_prepared_once_for_all_claims(self) -> None:
+        answer = "Revenue grew 20%. Profits doubled. Costs fell sharply."
+        sources = [
+            "The annual report shows revenue grew 20%.",
+            "Financial statements indicate profits doubled.",
+        ]
+        segmenter = _CountingSegmenter()
+
+        metrics = verify_facts(answer, sources, source_segmenter=segmenter)
+
+        assert metrics.num_claims == 3
+        assert segmenter.calls == len(sources)
+        for verification in metrics.claim_verifications:
+            expected = [
+                citation
+                for span in align_citations(
+                    verification.claim.text,
+                    sources,
+                    config=CitationConfig(
+                        top_k=3,
+                        min_answer_coverage=0.2,
+                        supported_answer_coverage=0.6,
+                        early_exit_answer_coverage=0.6,
+                    ),
+                )
+                for citation in span.citations
+            ]
+            assert verification.all_citations == expected
+
+    def test_duplicate_claims_aligned_once(self) -> None:
+        answer = "Revenue grew 20%. Profits doubled. Revenue grew 20%."
+        sources = ["The annual report shows revenue grew 20%."]
+        tokenizer = _CountingTokenizer()
+
+        metrics = verify_facts(answer, sources, tokenizer=tokenizer)
+
+        assert metrics.num_claims == 3
+        assert tokenizer.texts.count("Revenue grew 20%.") == 1
+        first, _, last = metrics.claim_verifications
+        assert first.claim.char_start != last.claim.char_start
+        assert first.status == last.status == "verified"
+        assert first.all_citations == last.all_citations
+
+    def test_parallel_alignment_matches_serial(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        answer = (
+            "Revenue grew 20%. Profits doubled. Costs fell sharply. "
+            "Margins improved. Debt was repaid. Staff grew by 10%."
+        )
+        sources = [
+            "The annual report shows revenue grew 20% and margins improved.",
+            "Financial statements indicate profits doubled and debt was repaid.",
+        ]
+        serial = verify_facts(answer, sources)
+
+        monkeypatch.setattr(citations, "_aligner_releases_gil", lambda _: True)
+        parallel = verify_facts(answer, sources)
+
+        assert parallel == serial
+
     def test_multiple_verified_claims(self) -> None:
         answer = "Revenue grew 20%. Profits doubled."
         sources = [
@@ -265,6 +351,21 @@ class TestVerifyFactsSupported:
         assert metrics.num_claims == 2
         assert metrics.num_verified >= 1
 
+    def test_source_ids_follow_citation_rank(self) -> None:
+        sources = [
+            SourceDocument(id="b", text="Revenue grew."),
+            SourceDocument(id="a", text="Revenue grew 20% this year."),
+            SourceDocument(id="b2", text="Revenue grew 20%."),
+        ]
+        config = FactVerificationConfig(citation_config=CitationConfig(top_k=5))
+
+        metrics = verify_facts("Revenue grew 20%.", sources, config=config)
+
+        verification = metrics.claim_verifications[0]
+        expected = list(dict.fromkeys(c.source_id for c in verification.all_citations))
+        assert len(expected) == 3
+        assert verification.source_ids == expected
+
 
 class TestVerifyFactsUnverified:
     """Tests for verify_facts with unverified claims."""
@@ -482,3 +583,71 @@ class TestVerifyFactsIntegration:
             assert verification.claim is not None
             assert verification.status in {"verified", "partial", "unverified"}
             assert 0.0 <= verification.confidence <= 1.0
+
+
+class TestVerifyFactsSourceCache:
+    """Tests for reuse of prepared sources across verify_facts calls."""
+
+    def test_sources_reused_with_same_components(self) -> None:
+        clear_source_cache()
+        sources = ["The annual report shows revenue grew 20%."]
+        segmenter = _CountingSegmenter()
+        tokenizer = SimpleTokenizer()
+
+        first = verify_facts(
+            "Revenue grew 20%.",
+            sources,
+            source_segmenter=segmenter,
+            tokenizer=tokenizer,
+        )
+        second = verify_facts(
+            "Revenue grew 20%.",
+            sources,
+            source_segmenter=segmenter,
+            tokenizer=tokenizer,
+        )
+
+        assert segmenter.calls == 1
+        assert second == first
+
+    def test_changed_sources_or_tokenizer_miss_cache(self) -> None:
+        clear_source_cache()
+        segmenter = _CountingSegmenter()
+        tokenizer = SimpleTokenizer()
+
+        verify_facts(
+            "Revenue grew 20%.",
+            ["Revenue grew 20%."],
+            source_segmenter=segmenter,
+            tokenizer=tokenizer,
+        )
+        verify_facts(
+            "Revenue grew 20%.",
+            ["Revenue grew 25%."],
+            source_segmenter=segmenter,
+            tokenizer=tokenizer,
+        )
+        verify_facts(
+            "Revenue grew 20%.",
+            ["Revenue grew 25%."],
+            source_segmenter=segmenter,
+            tokenizer=SimpleTokenizer(),
+        )
+
+        assert segmenter.calls == 3
+
+    def test_clear_source_cache(self) -> None:
+        clear_source_cache()
+        sources = ["Revenue grew 20%."]
+        segmenter = _CountingSegmenter()
+        tokenizer = SimpleTokenizer()
+
+        verify_facts(
+            "Revenue grew.", sources, source_segmenter=segmenter, tokenizer=tokenizer
+        )
+        clear_source_cache()
+        verify_facts(
+            "Revenue grew.", sources, source_segmenter=segmenter, tokenizer=tokenizer
+        )
+
+        assert segmenter.calls == 2
@@ -405,6 +405,30 @@ class TestComputeHallucinationMetricsMultipleSources:
 
         assert set(metrics.span_confidences[0].source_ids) == {"doc1", "doc2"}
 
+    def test_source_ids_deduplicated_in_citation_order(self) -> None:
+        span = AnswerSpan(text="Multi-source claim.", char_start=0, char_end=19)
+        citations = [
+            Citation(
+                score=score,
+                source_id=source_id,
+                source_index=0,
+                candidate_index=index,
+                char_start=0,
+                char_end=10,
+                evidence="Multi-source",
+                components={"answer_coverage": 0.8},
+            )
+            for index, (score, source_id) in enumerate(
+                [(2.0, "doc2"), (1.8, "doc1"), (1.5, "doc2"), (1.2, "doc3")]
+            )
+        ]
+
+        metrics = compute_hallucination_metrics(
+            [SpanCitations(answer_span=span, citations=citations, status="supported")]
+        )
+
+        assert metrics.span_confidences[0].source_ids == ["doc2", "doc1", "doc3"]
+
 
 class TestHallucinationMetricsIntegration:
     """Integration tests with align_citations."""
@@ -1,5 +1,7 @@
 """Tests for framework integration helpers."""
 
+import sys
+
 import pytest
 
 from cite_right import (
@@ -13,6 +15,7 @@ from cite_right import (
     from_langchain_documents,
     from_llamaindex_chunks,
     from_llamaindex_nodes,
+    integrations,
     is_langchain_available,
     is_langchain_document,
     is_llamaindex_available,
@@ -96,6 +99,83 @@ class TestLlamaIndexFunctionsRequireLibrary:
             from_llamaindex_chunks([])
 
 
+_STUB_MODULES = ("langchain_core", "llama_index", "llama_index.core")
+_LAZY_ATTRIBUTES = (
+    "LangChainDocument",
+    "LlamaIndexTextNode",
+    "LlamaIndexNodeWithScore",
+    "LlamaIndexNode",
+)
+
+
+@pytest.fixture
+def broken_framework_installs(tmp_path, monkeypatch):
+    """Put packages on the path that lack the submodules cite-right imports."""
+    (tmp_path / "langchain_core").mkdir()
+    (tmp_path / "langchain_core" / "__init__.py").write_text("")
+    (tmp_path / "llama_index" / "core").mkdir(parents=True)
+    (tmp_path / "llama_index" / "__init__.py").write_text("")
+    (tmp_path / "llama_index" / "core" / "__init__.py").write_text("")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(
+        integrations,
+        "LANGCHAIN_AVAILABLE",
+        integrations._module_available("langchain_core"),
+    )
+    monkeypatch.setattr(
+        integrations,
+        "LLAMAINDEX_AVAILABLE",
+        integrations._module_available("llama_index.core"),
+    )
+
+    def reset() -> None:
+        integrations._langchain_document_class.cache_clear()
+        integrations._llamaindex_node_classes.cache_clear()
+        for name in _LAZY_ATTRIBUTES:
+            integrations.__dict__.pop(name, None)
+
+    reset()
+    yield
+    reset()
+    for name in _STUB_MODULES:
+        sys.modules.pop(name, None)
+
+
+@pytest.mark.skipif(
+    LANGCHAIN_AVAILABLE or LLAMAINDEX_AVAILABLE,
+    reason="Test for when the frameworks are NOT installed",
+)
+@pytest.mark.usefixtures("broken_framework_installs")
+class TestBrokenFrameworkInstalls:
+    """Tests for framework packages whose submodules cannot be imported."""
+
+    def test_flags_come_from_the_package_spec(self):
+        """The stub packages are found, so the lazy import is what fails."""
+        assert integrations.LANGCHAIN_AVAILABLE
+        assert integrations.LLAMAINDEX_AVAILABLE
+
+    def test_type_checks_return_false(self):
+        """is_* helpers should fall back to False instead of raising."""
+        assert is_langchain_document(object()) is False
+        assert is_llamaindex_node(object()) is False
+
+    def test_lazy_attributes_are_none(self):
+        """Module attributes for the framework classes should be None."""
+        for name in _LAZY_ATTRIBUTES:
+            assert getattr(integrations, name) is None
+
+    def test_converters_raise_install_hint(self):
+        """Converters should raise the install hint, not ModuleNotFoundError."""
+        with pytest.raises(ImportError, match="pip install cite-right\\[langchain\\]"):
+            from_langchain_documents([])
+        with pytest.raises(ImportError, match="pip install cite-right\\[langchain\\]"):
+            from_langchain_chunks([])
+        with pytest.raises(ImportError, match="pip install cite-right\\[llamaindex\\]"):
+            from_llamaindex_nodes([])
+        with pytest.raises(ImportError, match="pip install cite-right\\[llamaindex\\]"):
+            from_llamaindex_chunks([])
+
+
 @pytest.mark.skipif(not LANGCHAIN_AVAILABLE, reason="langchain-core not installed")
 class TestLangChainIntegration:
     """Tests that use actual LangChain types."""
@@ -239,6 +319,23 @@ class TestLlamaIndexIntegration:
         assert sources[0].text == "Node content."
         assert sources[0].id == "doc.pdf"
 
+    def test_from_llamaindex_nodes_mixed_node_types(self):
+        """Should unwrap NodeWithScore objects mixed with plain TextNodes."""
+        from llama_index.core.schema import NodeWithScore, TextNode
+
+        plain = TextNode(text="Plain node.", metadata={"file_name": "a.pdf"})
+        inner = TextNode(text="Scored node.", metadata={"file_name": "b.pdf"})
+        nodes = [plain, NodeWithScore(node=inner, score=0.5), plain]
+
+        sources = from_llamaindex_nodes(nodes)
+
+        assert [s.text for s in sources] == [
+            "Plain node.",
+            "Scored node.",
+            "Plain node.",
+        ]
+        assert [s.id for s in sources] == ["a.pdf", "b.pdf", "a.pdf"]
+
     def test_from_llamaindex_nodes_custom_id_key(self):
         """Should support custom ID key."""
         from llama_index.core.schema import TextNode
@@ -1,4 +1,8 @@
 import importlib.util
+import os
+import subprocess
+import sys
+from pathlib import Path
 
 import pytest
 
@@ -41,3 +45,52 @@ def test_pysbd_segmenter_import_guard_message_when_missing() -> None:
 
     with pytest.raises(RuntimeError, match="pysbd is not installed"):
         PySBDSegmenter()
+
+
+def test_package_import_defers_optional_backend_wrappers() -> None:
+    code = (
+        "import sys, cite_right; "
+        "print(any(name in sys.modules for name in ("
+        "'cite_right.models.sbert_embedder', "
+        "'cite_right.text.tokenizer_tiktoken', "
+        "'cite_right.text.answer_segmenter_spacy')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+    import cite_right
+    from cite_right.text.tokenizer_tiktoken import TiktokenTokenizer
+
+    assert cite_right.TiktokenTokenizer is TiktokenTokenizer
+    assert "SentenceTransformerEmbedder" in dir(cite_right)
+
+
+def test_package_import_defers_framework_imports(tmp_path: Path) -> None:
+    package = tmp_path / "langchain_core"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "documents.py").write_text("class Document:\n    pass\n")
+    code = (
+        "import sys, cite_right; "
+        "print(cite_right.LANGCHAIN_AVAILABLE, "
+        "'langchain_core.documents' in sys.modules); "
+        "from langchain_core.documents import Document; "
+        "print(cite_right.is_langchain_document(Document()), "
+        "cite_right.LangChainDocument is Document)"
+    )
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join(
+            [str(tmp_path), *filter(None, [os.environ.get("PYTHONPATH")])]
+        ),
+    }
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    assert result.stdout.split() == ["True", "False", "True", "True"]
@@ -24,6 +24,17 @@ def test_simple_segmenter_offsets() -> None:
     assert segments[1].doc_char_end == 9
 
 
+def test_simple_segmenter_boundaries() -> None:
+    """Verify punctuation needs trailing whitespace and newlines are optional cuts."""
+    text = "v1.2 is out?! Yes;\tok\u00a0now\nnext line"
+
+    split = [s.text for s in SimpleSegmenter().segment(text)]
+    joined = [s.text for s in SimpleSegmenter(split_on_newlines=False).segment(text)]
+
+    assert split == ["v1.2 is out?!", "Yes;", "ok\u00a0now", "next line"]
+    assert joined == ["v1.2 is out?!", "Yes;", "ok\u00a0now\nnext line"]
+
+
 # =============================================================================
 # SpaCy Segmenter Tests
 # =============================================================================
@@ -96,3 +96,26 @@ def test_tokenizer_handles_mixed_punctuation() -> None:
     assert "Yes" in tokens
     assert "No" in tokens
     assert "maybe" in tokens
+
+
+def test_tokenizer_splits_numbers_from_words() -> None:
+    """Verify numbers keep inner separators and stop at letters or bare punctuation."""
+    tokenizer = SimpleTokenizer()
+    text = "1,250.5 15abc Q4 x²y 3² a--b it's_ok 1..2"
+    tokenized = tokenizer.tokenize(text)
+    tokens = [text[start:end] for start, end in tokenized.token_spans]
+
+    assert tokens == [
+        "1,250.5",
+        "15",
+        "abc",
+        "Q4",
+        "x²y",
+        "3²",
+        "a",
+        "b",
+        "it's",
+        "ok",
+        "1",
+        "2",
+    ]
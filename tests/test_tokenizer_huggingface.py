@@ -111,6 +111,17 @@ class TestHuggingFaceTokenizerWithTransformers:
             start2, _ = result.token_spans[i + 1]
             assert end1 <= start2, f"Spans overlap at index {i}"
 
+    def test_batch_tokenize_matches_tokenize(self, tokenizer):
+        """Test that batch tokenization matches per-text tokenization."""
+        texts = ["Hello, world!", "", "Revenue grew 5% in 2024."]
+        results = tokenizer.batch_tokenize(texts)
+
+        assert [result.text for result in results] == texts
+        for text, result in zip(texts, results, strict=True):
+            expected = tokenizer.tokenize(text)
+            assert result.token_ids == expected.token_ids
+            assert result.token_spans == expected.token_spans
+
 
 class TestHuggingFaceTokenizerFromPretrained:
     """Test suite for from_pretrained class method."""
@@ -201,6 +212,18 @@ class TestHuggingFaceTokenizerWithTokenizers:
             token_text = text[start:end]
             assert len(token_text) > 0, "Token span is empty"
 
+    def test_batch_tokenize_matches_tokenize(self, fast_tokenizer):
+        """Test that batch tokenization matches per-text tokenization."""
+        tok = HuggingFaceTokenizer(fast_tokenizer)
+        texts = ["hello world", "", "The quick brown fox"]
+        results = tok.batch_tokenize(texts)
+
+        assert [result.text for result in results] == texts
+        for text, result in zip(texts, results, strict=True):
+            expected = tok.tokenize(text)
+            assert result.token_ids == expected.token_ids
+            assert result.token_spans == expected.token_spans
+
 
 class TestHuggingFaceTokenizerErrors:
     """Test error handling in HuggingFaceTokenizer."""
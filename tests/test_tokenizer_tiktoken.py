@@ -103,6 +103,7 @@ class TestTiktokenTokenizer:
         result = tokenizer.tokenize("Test text")
         assert len(result.token_ids) > 0
         assert tokenizer.encoding_name == "cl100k_base"
+        assert tokenizer.backend == "tiktoken"
 
     def test_special_characters(self, tokenizer):
         """Test tokenization of text with special characters."""
@@ -161,3 +162,26 @@ class TestTiktokenTokenizer:
         assert result.token_spans[0][0] == 0
         # Last span should end at len(text)
         assert result.token_spans[-1][1] == len(text)
+
+    def test_batch_tokenize_matches_tokenize(self, tokenizer):
+        """Test that batch tokenization matches per-text tokenization."""
+        texts = ["Hello, world!", "", "café 日本語", "The quick brown fox"]
+        results = tokenizer.batch_tokenize(texts)
+
+        assert [result.text for result in results] == texts
+        for text, result in zip(texts, results, strict=True):
+            expected = tokenizer.tokenize(text)
+            assert result.token_ids == expected.token_ids
+            assert result.token_spans == expected.token_spans
+
+    def test_batch_tokenize_num_threads(self, tokenizer, encoding):
+        """Test that the encode_batch thread count does not change results."""
+        texts = [f"Document {i}: revenue grew {i}% in Q{i % 4 + 1}." for i in range(32)]
+        single = TiktokenTokenizer(encoding=encoding, num_threads=1)
+
+        assert single.batch_tokenize(texts) == tokenizer.batch_tokenize(texts)
+
+    def test_invalid_num_threads(self, encoding):
+        """Test that a thread count below 1 is rejected."""
+        with pytest.raises(ValueError, match="num_threads"):
+            TiktokenTokenizer(encoding=encoding, num_threads=0)